@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import asyncio
 import ctypes
+import functools
 import re
+import string
 import sys
-from dataclasses import dataclass
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from operator import itemgetter
 from tkinter import ttk
-from typing import Any
+from typing import Any, Callable, Coroutine, Sequence, TypeVar
 
 import customtkinter as ctk
 
@@ -15,7 +21,7 @@ from .settings_store import SettingsStore
 from .storage import ExcelStore
 
 
-MONTHS = [
+MONTHS: tuple[str, ...] = (
     "January",
     "February",
     "March",
@@ -28,45 +34,446 @@ MONTHS = [
     "October",
     "November",
     "December",
-]
+)
+_MONTH_INDEX: dict[str, int] = {m: i for i, m in enumerate(MONTHS, start=1)}
 
 
-def _safe_int(s: str, default: int) -> int:
+def _safe_int(s: str | int, default: int) -> int:
+    if type(s) is int:
+        return s
     try:
         return int(s)
-    except Exception:
+    except (ValueError, TypeError):
         return default
 
 
+_FIELD_KEEP = frozenset(string.ascii_letters + string.digits + "_-")
+# Deletes every ASCII char we don't keep (whitespace is already gone after split/join).
+_FIELD_TRANS = str.maketrans("", "", "".join(chr(c) for c in range(128) if chr(c) not in _FIELD_KEEP))
+_BAD_RE = re.compile(r"[^a-zA-Z0-9_\-]")
+
+
 def _normalize_field_name(name: str) -> str:
-    name = name.strip()
-    name = re.sub(r"\s+", "_", name)
-    name = re.sub(r"[^a-zA-Z0-9_\-]", "", name)
-    return name
+    name = "_".join(name.split())
+    if name.isascii():
+        return name.translate(_FIELD_TRANS)
+    return _BAD_RE.sub("", name)
+
+
+def _load_dll(name: str):
+    try:
+        return ctypes.WinDLL(name)  # type: ignore[attr-defined]
+    except Exception:
+        return None
+
+
+# Resolved once at import; both stay None off Windows.
+_shcore = _load_dll("shcore") if sys.platform == "win32" else None
+_user32 = _load_dll("user32") if sys.platform == "win32" else None
 
 
 def _enable_high_dpi() -> None:
     """Best-effort: make the app crisp on Windows high-DPI displays."""
 
-    if not sys.platform.startswith("win"):
+    if sys.platform != "win32":
         return
     try:
         # Windows 8.1+
-        ctypes.windll.shcore.SetProcessDpiAwareness(2)  # type: ignore[attr-defined]
+        _shcore.SetProcessDpiAwareness(2)  # type: ignore[union-attr]
     except Exception:
         try:
             # Older fallback
-            ctypes.windll.user32.SetProcessDPIAware()  # type: ignore[attr-defined]
+            _user32.SetProcessDPIAware()  # type: ignore[union-attr]
         except Exception:
             pass
 
 
-@dataclass
+@dataclass(slots=True)
 class Selected:
     entity: str = ""
     person_id: str = ""
 
 
+T = TypeVar("T")
+
+# Bounds for how often Tk pumps the asyncio loop (see HTSMSApp._pump_loop).
+_PUMP_MIN_MS = 5
+_PUMP_MAX_MS = 100
+
+# Idle time before deferred workbook edits are written to disk.
+_FLUSH_IDLE_MS = 2000
+
+# Bits for HTSMSApp._request_refresh; everything requested before Tk's next idle
+# point is refreshed in a single pass.
+_R_STUDENTS = 1
+_R_TEACHERS = 2
+_R_DASHBOARD = 4
+_R_ACTIVITY = 8
+_PAGE_REFRESH = {"students": _R_STUDENTS, "teachers": _R_TEACHERS, "dashboard": _R_DASHBOARD, "activity": _R_ACTIVITY}
+
+# Typing in a search box refreshes once the user pauses this long.
+_SEARCH_DEBOUNCE_MS = 150
+
+# A pending debounced call is kept if rescheduling would only move it by this much.
+_DEBOUNCE_SLACK_S = 0.03
+
+# Students/teachers trees pre-allocate this many custom-field columns (cf1..cfN)
+# and show/hide them with displaycolumns instead of rebuilding the widget.
+MAX_CUSTOM_COLUMNS = 10
+_CF_COLUMNS = tuple(f"cf{i}" for i in range(1, MAX_CUSTOM_COLUMNS + 1))
+_STUDENT_COLUMNS = ("id", "name", "class", "section", "primary", "secondary")
+_TEACHER_COLUMNS = ("id", "name", "role", "primary", "secondary")
+
+# Must match the Treeview style rowheight configured in _configure_ttk.
+ROW_HEIGHT = 28
+
+# How many of the most recent events the Activity page keeps.
+ACTIVITY_LIMIT = 700
+
+
+@dataclass
+class _PersonIndex:
+    """Column-wise (SoA) snapshot of students or teachers, sorted by id.
+
+    Search runs on every keystroke, so the display row is prepared once per store
+    version. The lowercased search blobs are only built on the first non-empty
+    query, and reused across rebuilds through ``blob_cache`` while a row's
+    searchable fields are unchanged.
+    """
+
+    version: int = -1
+    fields: tuple[str, ...] = ()
+    ids: list[str] = field(default_factory=list)
+    search_fields: list[tuple[str, ...]] = field(default_factory=list)
+    classes_lc: list[str] = field(default_factory=list)
+    rows: list[tuple[str, ...]] = field(default_factory=list)
+    blob_cache: dict[str, tuple[tuple[str, ...], str]] | None = field(default=None, repr=False)
+    _blobs_lc: list[str] | None = field(default=None, repr=False)
+
+    def blobs_lc(self) -> list[str]:
+        if self._blobs_lc is None:
+            cache = self.blob_cache if self.blob_cache is not None else {}
+            blobs: list[str] = []
+            for pid, fs in zip(self.ids, self.search_fields):
+                hit = cache.get(pid)
+                if hit is None or hit[0] != fs:
+                    hit = cache[pid] = (fs, " ".join(fs).lower())
+                blobs.append(hit[1])
+            self._blobs_lc = blobs
+        return self._blobs_lc
+
+    def filter(self, q: str, class_filter: str = "") -> list[int]:
+        if class_filter:
+            hits = [i for i, c in enumerate(self.classes_lc) if c == class_filter]
+            if q:
+                blobs = self.blobs_lc()
+                hits = [i for i in hits if q in blobs[i]]
+            return hits
+        if q:
+            return [i for i, b in enumerate(self.blobs_lc()) if q in b]
+        return list(range(len(self.ids)))
+
+
+@dataclass
+class _ActivityLog:
+    """Newest-first activity rows with their search blobs.
+
+    ``top`` numbers the newest event; row i gets iid ``top - i`` so ids stay put when
+    new events are prepended and the tree only has to insert the new rows.
+    """
+
+    version: int = -1
+    epoch: int = -1
+    top: int = 0
+    events: list[dict[str, Any]] = field(default_factory=list)
+    blobs: list[str] = field(default_factory=list)
+    rows: list[tuple[str, ...]] = field(default_factory=list)
+
+    def iid(self, i: int) -> str:
+        return str(self.top - i)
+
+
+def _s(v: Any) -> str:
+    """Cell value as display text; skips str() for values that already are strings."""
+    return v if type(v) is str else "" if v is None else str(v)
+
+
+def _search_text(entry: Any) -> str:
+    """Normalized text of a search/filter entry.
+
+    Plain str.lower() is used on purpose: CPython already special-cases ASCII
+    strings, and bytes-based lowering measured slower. Non-ASCII text is
+    lowercased but not case-folded, so e.g. "STRASSE" does not match "straße".
+    """
+    return (entry.get() or "").strip().lower()
+
+
+# C-level multi-key fetches for the per-row loops below. Rows read from the
+# workbook carry every header; _row_fields falls back to .get() if one doesn't.
+_STUDENT_KEYS = ("student_id", "first_name", "last_name", "class", "section", "primary_contact", "secondary_contact")
+_TEACHER_KEYS = ("teacher_id", "first_name", "last_name", "role", "primary_contact", "secondary_contact")
+_EVENT_KEYS = ("timestamp", "action", "entity_type", "entity_id", "details")
+_student_fields = itemgetter(*_STUDENT_KEYS)
+_teacher_fields = itemgetter(*_TEACHER_KEYS)
+_event_fields = itemgetter(*_EVENT_KEYS)
+
+
+def _row_fields(r: dict[str, Any], getter: itemgetter, keys: tuple[str, ...]) -> tuple[str, ...]:
+    try:
+        values = getter(r)
+    except KeyError:
+        values = map(r.get, keys)
+    return tuple(map(_s, values))
+
+
+def _activity_row(ev: dict[str, Any]) -> tuple[tuple[str, ...], str]:
+    ts, action, entity_type, entity_id, details = fs = _row_fields(ev, _event_fields, _EVENT_KEYS)
+    return (ts, action, f"{entity_type}:{entity_id}", details), " ".join(fs).lower()
+
+
+def _custom_values(r: dict[str, Any], fields: tuple[str, ...]) -> tuple[str, ...]:
+    return tuple(_s(r.get(cf)) for cf in fields[:MAX_CUSTOM_COLUMNS])
+
+
+def _build_student_index(
+    records: list[dict[str, Any]],
+    version: int,
+    fields: tuple[str, ...] = (),
+    blob_cache: dict[str, tuple[tuple[str, ...], str]] | None = None,
+) -> _PersonIndex:
+    idx = _PersonIndex(version=version, fields=fields, blob_cache=blob_cache)
+    keyed = [(fs, r) for r in records if (fs := _row_fields(r, _student_fields, _STUDENT_KEYS))[0]]
+    keyed.sort(key=lambda kr: kr[0][0])
+    for fs, r in keyed:
+        sid, first, last, cls, sec, primary, secondary = fs
+        idx.ids.append(sid)
+        idx.search_fields.append(fs)
+        idx.classes_lc.append(cls.strip().lower())
+        idx.rows.append(
+            (sid, f"{first} {last}".strip(), cls, sec, primary, secondary)
+            + _custom_values(r, fields)
+        )
+    return idx
+
+
+def _build_teacher_index(
+    records: list[dict[str, Any]],
+    version: int,
+    fields: tuple[str, ...] = (),
+    blob_cache: dict[str, tuple[tuple[str, ...], str]] | None = None,
+) -> _PersonIndex:
+    idx = _PersonIndex(version=version, fields=fields, blob_cache=blob_cache)
+    keyed = [(fs, r) for r in records if (fs := _row_fields(r, _teacher_fields, _TEACHER_KEYS))[0]]
+    keyed.sort(key=lambda kr: kr[0][0])
+    for fs, r in keyed:
+        tid, first, last, role, primary, secondary = fs
+        idx.ids.append(tid)
+        idx.search_fields.append(fs)
+        idx.rows.append(
+            (tid, f"{first} {last}".strip(), role, primary, secondary)
+            + _custom_values(r, fields)
+        )
+    return idx
+
+
+# One Tcl proc inserts a whole batch so a refresh costs a single Python->Tcl call
+# instead of one per row. Rows arrive as a nested tuple, which tkinter marshals
+# into a proper Tcl list, so no manual quoting/escaping is needed.
+_BULK_INSERT_PROC = """
+proc ::htsms_bulk_insert {w index rows} {
+    foreach r $rows {
+        $w insert {} $index -id [lindex $r 0] -tags [lindex $r 1] -values [lrange $r 2 end]
+        if {$index ne "end"} { incr index }
+    }
+}
+proc ::htsms_bulk_update {w rows} {
+    foreach r $rows {
+        $w item [lindex $r 0] -tags [lindex $r 1] -values [lrange $r 2 end]
+    }
+}
+"""
+_bulk_ready: set[int] = set()
+_STRIPE_TAGS = ("", "stripe")
+
+
+def _bulk_call(tree: ttk.Treeview, proc: str, *args: Any) -> None:
+    key = id(tree.tk)
+    if key not in _bulk_ready:
+        tree.tk.eval(_BULK_INSERT_PROC)
+        _bulk_ready.add(key)
+    tree.tk.call(proc, tree._w, *args)
+
+
+def _bulk_insert(tree: ttk.Treeview, index: int | str, rows: list[tuple[str, ...]]) -> None:
+    """Insert rows (each ``(iid, tags, *values)``) at ``index`` with one Tcl call."""
+
+    if rows:
+        _bulk_call(tree, "::htsms_bulk_insert", index, tuple(rows))
+
+
+def _bulk_update(tree: ttk.Treeview, rows: list[tuple[str, ...]]) -> None:
+    """Set tags and values of existing rows (each ``(iid, tags, *values)``) with one Tcl call."""
+
+    if rows:
+        _bulk_call(tree, "::htsms_bulk_update", tuple(rows))
+
+
+class _TreeWindow:
+    """Show only the visible slice of a large row list inside a ttk.Treeview.
+
+    Every tree.insert is a round-trip through Tcl, so pushing thousands of rows on
+    each refresh dominates the UI thread. Instead we keep the full (filtered) row
+    list in Python and reconcile just the rows that fit in the viewport. The tree
+    itself never scrolls; the scrollbar, mouse wheel and arrow keys move the window.
+    """
+
+    def __init__(self, tree: ttk.Treeview, vsb: ttk.Scrollbar):
+        self.tree = tree
+        self.vsb = vsb
+        self.iids: list[str] = []
+        self.rows: list[tuple[str, ...]] = []
+        self.start = 0
+        self.selected_iid = ""
+        self._pos: dict[str, int] = {}
+        self._shown: list[str] = []
+        # iid -> (tag, values) currently in the tree, to skip unchanged rows.
+        self._shown_vals: dict[str, tuple[str, tuple[str, ...]]] = {}
+
+        tree.tag_configure("stripe", background="#f9fafb")
+        vsb.configure(command=self.yview)
+        # The tree only ever holds the window, so its own scroll fractions are meaningless.
+        tree.configure(yscrollcommand=lambda *_a: None)
+        tree.bind("<Configure>", lambda _e: self.render(), add="+")
+        tree.bind("<<TreeviewSelect>>", self._on_select, add="+")
+        tree.bind("<MouseWheel>", self._on_wheel)
+        tree.bind("<Button-4>", lambda _e: self._scroll_by(-3))
+        tree.bind("<Button-5>", lambda _e: self._scroll_by(3))
+        tree.bind("<Up>", lambda _e: self._step_focus(-1))
+        tree.bind("<Down>", lambda _e: self._step_focus(1))
+        tree.bind("<Prior>", lambda _e: self._step_focus(-self._visible()))
+        tree.bind("<Next>", lambda _e: self._step_focus(self._visible()))
+        tree.bind("<Home>", lambda _e: self._step_focus(-len(self.rows)))
+        tree.bind("<End>", lambda _e: self._step_focus(len(self.rows)))
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def set_rows(self, iids: list[str], rows: list[tuple[str, ...]]) -> None:
+        self.iids = iids
+        self.rows = rows
+        self._pos = {iid: i for i, iid in enumerate(iids)}
+        self.render()
+
+    def contains(self, iid: str) -> bool:
+        return iid in self._pos
+
+    def select(self, iid: str) -> None:
+        self.selected_iid = iid
+        if iid in self._shown_vals and self.tree.selection() != (iid,):
+            self.tree.selection_set(iid)
+
+    # ---- scrolling ----
+    def _visible(self) -> int:
+        # The heading takes roughly one row; a partially visible last row is fine.
+        return max(1, self.tree.winfo_height() // ROW_HEIGHT)
+
+    def yview(self, *args: str) -> None:
+        if not args:
+            return
+        if args[0] == "moveto":
+            self.yview_moveto(float(args[1]))
+        elif args[0] == "scroll":
+            step = self._visible() if args[2] == "pages" else 1
+            self._scroll_by(int(args[1]) * step)
+
+    def yview_moveto(self, fraction: float) -> None:
+        self.start = int(fraction * len(self.rows))
+        self.render()
+
+    def _scroll_by(self, delta: int) -> str:
+        self.start += delta
+        self.render()
+        return "break"
+
+    def _on_wheel(self, event) -> str:
+        return self._scroll_by(-3 if event.delta > 0 else 3)
+
+    def _step_focus(self, delta: int) -> str:
+        if not self.rows:
+            return "break"
+        cur = self._pos.get(self.tree.focus(), self.start)
+        target = max(0, min(len(self.rows) - 1, cur + delta))
+        vis = self._visible()
+        if target < self.start:
+            self.start = target
+        elif target >= self.start + vis:
+            self.start = target - vis + 1
+        self.render()
+        iid = self.iids[target]
+        self.tree.focus(iid)
+        self.select(iid)
+        return "break"
+
+    def _on_select(self, _event=None) -> None:
+        sel = self.tree.selection()
+        if sel:
+            self.selected_iid = sel[0]
+
+    # ---- reconcile ----
+    def render(self) -> None:
+        n = len(self.rows)
+        vis = self._visible()
+        start = max(0, min(self.start, n - vis))
+        self.start = start
+        want = self.iids[start : start + vis]
+
+        # Diff against what the tree holds: delete rows that left the window, insert
+        # new ones (batched per contiguous run) and only touch rows whose values or
+        # stripe changed (batched into one call). Both lists follow the same global
+        # order, so kept rows never need to move.
+        keep = set(want)
+        stale = [iid for iid in self._shown if iid not in keep]
+        if stale:
+            self.tree.delete(*stale)
+            for iid in stale:
+                del self._shown_vals[iid]
+        shown_vals = self._shown_vals
+        run: list[tuple[str, ...]] = []
+        run_at = 0
+        changed: list[tuple[str, ...]] = []
+        for pos, iid in enumerate(want):
+            i = start + pos
+            tag = _STRIPE_TAGS[i & 1]
+            row = self.rows[i]
+            cur = shown_vals.get(iid)
+            if cur is None:
+                if not run:
+                    run_at = pos
+                run.append((iid, tag, *row))
+                shown_vals[iid] = (tag, row)
+                continue
+            if run:
+                _bulk_insert(self.tree, run_at, run)
+                run = []
+            # Rows come from cached indexes, so an unchanged row is usually the very
+            # same tuple; the identity check skips the element-wise compare.
+            if cur[0] != tag or (cur[1] is not row and cur[1] != row):
+                changed.append((iid, tag, *row))
+                shown_vals[iid] = (tag, row)
+        if run:
+            _bulk_insert(self.tree, run_at, run)
+        _bulk_update(self.tree, changed)
+        self._shown = want
+
+        if self.selected_iid in self._shown_vals and self.tree.selection() != (self.selected_iid,):
+            self.tree.selection_set(self.selected_iid)
+
+        if n:
+            self.vsb.set(start / n, min(1.0, (start + vis) / n))
+        else:
+            self.vsb.set(0.0, 1.0)
+
+
 class HTSMSApp(ctk.CTk):
     """High Tech School Management System UI.
 
@@ -76,14 +483,22 @@ class HTSMSApp(ctk.CTk):
     - "Web-like" layout: sidebar navigation + card panels.
     """
 
+    # Nav button colors, shared so show_page doesn't rebuild them per click.
+    _ACTIVE_FG = ("#dbeafe", "#0b3b70")
+    _ACTIVE_TX = ("#111827", "#ffffff")
+    _INACTIVE_FG = "transparent"
+
     def __init__(self):
         super().__init__()
 
         self.err_logger = ErrorLogger()
         self.settings_store = SettingsStore()
         self.settings = self.settings_store.load()
+        # What is on disk; save_settings diffs against it to skip no-op writes.
+        self._settings_snapshot = self.settings
 
         # Theme / scaling first (before building widgets)
+        self._last_ui: tuple[str | None, float | None] = (None, None)
         ctk.set_default_color_theme("blue")
         self._apply_ui_settings()
 
@@ -94,16 +509,53 @@ class HTSMSApp(ctk.CTk):
         self.protocol("WM_DELETE_WINDOW", self._on_close)
 
         self.store = ExcelStore()
-        self.store.ensure_workbook(self.settings.student_custom_fields, self.settings.teacher_custom_fields)
+
+        # Workbook I/O runs on one worker thread (keeps writes ordered); coroutines
+        # awaiting it run on an asyncio loop pumped from Tk's event loop.
+        self._loop = asyncio.new_event_loop()
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="htsms-io")
+        self._io_pending = 0
+        self._pumping = False
+        self._pump_id = self.after(_PUMP_MIN_MS, self._pump_loop)
+
+        # Opening/repairing the workbook is the slowest part of startup; let the window
+        # come up while it runs. Every later store call queues behind it on the worker.
+        self._submit(
+            "ensure_workbook",
+            self.store.ensure_workbook,
+            list(self.settings.student_custom_fields),
+            list(self.settings.teacher_custom_fields),
+        )
+
+        # Edits stay in memory and are written to disk after a short idle period.
+        self.store.defer_saves = True
+        self._dirty: set[str] = set()
 
         self.selected = Selected()
-        self._after_ids: dict[str, str] = {}
+        self._student_index = _PersonIndex()
+        self._teacher_index = _PersonIndex()
+        # id -> (searchable fields, lowercased blob); survives index rebuilds, evicted on edit/delete.
+        self._student_blob_cache: dict[str, tuple[tuple[str, ...], str]] = {}
+        self._teacher_blob_cache: dict[str, tuple[tuple[str, ...], str]] = {}
+        # (store version, events, blobs) for the activity search.
+        self._activity_log = _ActivityLog()
+        self._after_ids: dict[str, tuple[str, Callable[[], Any], float]] = {}
         self._nav_buttons: dict[str, ctk.CTkButton] = {}
         self._pages: dict[str, ctk.CTkFrame] = {}
+        self._active_page: str | None = None
+        self._pending_refresh = 0
+        # Store state each page last rendered; lets show_page skip no-op refreshes.
+        self._freshness: dict[str, tuple[Any, ...]] = {}
+        self._card_ctor = functools.partial(
+            ctk.CTkFrame,
+            corner_radius=14,
+            border_width=1,
+            border_color=("#e5e7eb", "#1f2937"),
+        )
 
         self._configure_ttk()
         self._build_shell()
-        self.refresh_all()
+        # Only the dashboard is loaded up-front; other pages refresh on first visit.
         self.show_page("dashboard")
 
     # Tkinter callback errors can be silent; log them.
@@ -118,19 +570,27 @@ class HTSMSApp(ctk.CTk):
         mode = (self.settings.appearance_mode or "System").strip().capitalize()
         if mode not in {"Light", "Dark", "System"}:
             mode = "System"
-        ctk.set_appearance_mode(mode)
 
         try:
-            scale = float(getattr(self.settings, "ui_scaling", 1.0) or 1.0)
+            scale = float(self.settings.ui_scaling or 1.0)
         except Exception:
             scale = 1.0
         if scale < 0.8:
             scale = 0.8
         if scale > 1.4:
             scale = 1.4
-        # Using the same value for window+widget scaling avoids fractional blur.
-        ctk.set_window_scaling(scale)
-        ctk.set_widget_scaling(scale)
+
+        # Re-scaling walks and re-lays out every CTk widget; skip it when nothing changed.
+        if (mode, scale) == self._last_ui:
+            return
+        last_mode, last_scale = self._last_ui
+        if mode != last_mode:
+            ctk.set_appearance_mode(mode)
+        if scale != last_scale:
+            # Using the same value for window+widget scaling avoids fractional blur.
+            ctk.set_window_scaling(scale)
+            ctk.set_widget_scaling(scale)
+        self._last_ui = (mode, scale)
 
     def _configure_ttk(self) -> None:
         # Make Treeview look "clean" and readable.
@@ -139,10 +599,16 @@ class HTSMSApp(ctk.CTk):
             style.theme_use("clam")
             style.configure(
                 "Treeview",
-                rowheight=28,
+                rowheight=ROW_HEIGHT,
                 borderwidth=0,
                 relief="flat",
             )
+            # Fixed selection colors (and one map call) instead of the theme's defaults.
+            style.map(
+                "Treeview",
+                background=[("selected", "#dbeafe")],
+                foreground=[("selected", "#111827")],
+            )
             style.configure(
                 "Treeview.Heading",
                 font=("Segoe UI", 10, "bold"),
@@ -194,15 +660,25 @@ class HTSMSApp(ctk.CTk):
         self.pages_stack.grid_columnconfigure(0, weight=1)
         self.pages_stack.grid_rowconfigure(0, weight=1)
 
-        self._pages["dashboard"] = self._build_dashboard_page(self.pages_stack)
-        self._pages["students"] = self._build_students_page(self.pages_stack)
-        self._pages["teachers"] = self._build_teachers_page(self.pages_stack)
-        self._pages["activity"] = self._build_activity_page(self.pages_stack)
-        self._pages["settings"] = self._build_settings_page(self.pages_stack)
-
-        for p in self._pages.values():
-            p.grid(row=0, column=0, sticky="nsew")
-            p.grid_remove()
+        # Pages are built on first visit; only the dashboard (initial view) is built up-front.
+        self._page_builders: dict[str, Callable[[ctk.CTkFrame], ctk.CTkFrame]] = {
+            "dashboard": self._build_dashboard_page,
+            "students": self._build_students_page,
+            "teachers": self._build_teachers_page,
+            "activity": self._build_activity_page,
+            "settings": self._build_settings_page,
+        }
+        self._ensure_page("dashboard")
+
+    def _ensure_page(self, key: str) -> ctk.CTkFrame:
+        page = self._pages.get(key)
+        if page is None:
+            page = self._page_builders[key](self.pages_stack)
+            page.grid(row=0, column=0, sticky="nsew")
+            page.grid_remove()
+            self._pages[key] = page
+            self._load_page_defaults(key)
+        return page
 
     def _nav_item(self, key: str, label: str, row: int) -> None:
         btn = ctk.CTkButton(
@@ -211,7 +687,7 @@ class HTSMSApp(ctk.CTk):
             anchor="w",
             height=40,
             corner_radius=10,
-            fg_color="transparent",
+            fg_color=self._INACTIVE_FG,
             hover_color=("#e5e7eb", "#1f2937"),
             command=lambda k=key: self.show_page(k),
         )
@@ -219,19 +695,23 @@ class HTSMSApp(ctk.CTk):
         self._nav_buttons[key] = btn
 
     def show_page(self, key: str) -> None:
-        for k, page in self._pages.items():
-            if k == key:
-                page.grid()
-            else:
-                page.grid_remove()
+        if key == self._active_page:
+            return
 
-        for k, btn in self._nav_buttons.items():
-            if k == key:
-                btn.configure(fg_color=("#dbeafe", "#0b3b70"), text_color=("#111827", "#ffffff"))
-            else:
-                btn.configure(fg_color="transparent", text_color=("#111827", "#ffffff"))
+        # Only the outgoing and incoming page/button change; every CTkButton.configure
+        # redraws its canvas, so don't touch the others.
+        prev = self._active_page
+        if prev is not None:
+            self._pages[prev].grid_remove()
+            self._nav_buttons[prev].configure(fg_color=self._INACTIVE_FG, text_color=self._ACTIVE_TX)
+        self._ensure_page(key).grid()
+        self._nav_buttons[key].configure(fg_color=self._ACTIVE_FG, text_color=self._ACTIVE_TX)
+        self._active_page = key
 
         # Keep pages feeling snappy by refreshing only what matters.
+        stamp = self._page_stamp(key)
+        if stamp is not None and self._freshness.get(key) == stamp:
+            return
         if key == "dashboard":
             self.refresh_dashboard()
         elif key == "students":
@@ -243,15 +723,22 @@ class HTSMSApp(ctk.CTk):
         elif key == "settings":
             self.refresh_custom_fields_views()
 
+    def _page_stamp(self, key: str) -> tuple[Any, ...] | None:
+        if key == "dashboard":
+            return (self.store.version, self.dash_year.get(), self.dash_month.get())
+        if key == "students":
+            return (self.store.version, tuple(self.settings.student_custom_fields))
+        if key == "teachers":
+            return (self.store.version, tuple(self.settings.teacher_custom_fields))
+        if key == "activity":
+            return (self.store.version,)
+        if key == "settings":
+            return (self.settings.student_custom_fields, self.settings.teacher_custom_fields)
+        return None
+
     # ---------------- Reusable "card" helpers ----------------
     def _card(self, parent: ctk.CTkFrame, **kwargs: Any) -> ctk.CTkFrame:
-        return ctk.CTkFrame(
-            parent,
-            corner_radius=14,
-            border_width=1,
-            border_color=("#e5e7eb", "#1f2937"),
-            **kwargs,
-        )
+        return self._card_ctor(parent, **kwargs)
 
     def _page_title(self, parent: ctk.CTkFrame, title: str, subtitle: str) -> ctk.CTkFrame:
         bar = ctk.CTkFrame(parent, corner_radius=0)
@@ -264,13 +751,98 @@ class HTSMSApp(ctk.CTk):
         )
         return bar
 
-    def _debounce(self, key: str, delay_ms: int, fn) -> None:
-        if key in self._after_ids:
+    def _debounce(self, key: str, delay_ms: int, fn: Callable[[], Any]) -> None:
+        due = time.monotonic() + delay_ms / 1000.0
+        pending = self._after_ids.get(key)
+        if pending is not None:
+            after_id, pending_fn, pending_due = pending
+            # Same callback already queued and due (almost) when we'd schedule it:
+            # keep it instead of churning Tk's after queue on every keystroke.
+            if pending_fn == fn and due - pending_due <= _DEBOUNCE_SLACK_S:
+                return
             try:
-                self.after_cancel(self._after_ids[key])
+                self.after_cancel(after_id)
             except Exception:
                 pass
-        self._after_ids[key] = self.after(delay_ms, fn)
+
+        def fire() -> None:
+            self._after_ids.pop(key, None)
+            fn()
+
+        after_id = self.after_idle(fire) if delay_ms <= 0 else self.after(delay_ms, fire)
+        self._after_ids[key] = (after_id, fn, due)
+
+    # ---------------- Async I/O ----------------
+    def _pump_loop(self) -> None:
+        loop = self._loop
+        self._pumping = True
+        try:
+            # Run exactly one iteration of the asyncio loop.
+            loop.call_soon(loop.stop)
+            loop.run_forever()
+        finally:
+            self._pumping = False
+        self._pump_id = self.after(self._next_pump_delay(), self._pump_loop)
+
+    def _next_pump_delay(self) -> int:
+        # Poll fast while work is in flight, back off when idle.
+        loop = self._loop
+        if getattr(loop, "_ready", None) or self._io_pending:
+            return _PUMP_MIN_MS
+        scheduled = getattr(loop, "_scheduled", None)
+        if scheduled:
+            due_ms = int((scheduled[0].when() - loop.time()) * 1000)
+            return max(_PUMP_MIN_MS, min(_PUMP_MAX_MS, due_ms))
+        return _PUMP_MAX_MS
+
+    def _wake_loop(self) -> None:
+        if self._pumping:
+            # The running pump will see the new work and reschedule itself quickly.
+            return
+        self.after_cancel(self._pump_id)
+        self._pump_id = self.after_idle(self._pump_loop)
+
+    def _spawn(self, coro: Coroutine[Any, Any, Any], context: str) -> None:
+        def done(task: asyncio.Task) -> None:
+            if not task.cancelled() and task.exception() is not None:
+                self.err_logger.log_exception(task.exception(), context)  # type: ignore[arg-type]
+
+        self._loop.create_task(coro).add_done_callback(done)
+        self._wake_loop()
+
+    async def _io(self, fn: Callable[..., T], *args: Any) -> T:
+        self._io_pending += 1
+        try:
+            return await self._loop.run_in_executor(self._io_pool, functools.partial(fn, *args))
+        finally:
+            self._io_pending -= 1
+
+    async def _io_then(self, then: Callable[[T], None], fn: Callable[..., T], *args: Any) -> None:
+        # Read on the worker, then hand the result to a plain Tk callback; dialogs
+        # run a nested mainloop and must not be opened from inside the asyncio loop.
+        value = await self._io(fn, *args)
+        self.after(0, then, value)
+
+    def _submit(self, context: str, fn: Callable[..., Any], *args: Any) -> None:
+        """Queue a fire-and-forget workbook write behind any pending I/O."""
+
+        def done(fut: Future) -> None:
+            exc = fut.exception()
+            if exc is not None:
+                self.err_logger.log_exception(exc, context)  # type: ignore[arg-type]
+
+        self._io_pool.submit(fn, *args).add_done_callback(done)
+
+    def _mark_dirty(self, what: str) -> None:
+        # Serializing + zipping the whole xlsx is the slow part; batch it per idle period.
+        self._dirty.add(what)
+        self._debounce("flush", _FLUSH_IDLE_MS, self._flush_dirty)
+
+    def _flush_dirty(self) -> None:
+        if not self._dirty:
+            return
+        self._dirty.clear()
+        self._submit("flush", self.store.flush)
 
     # ---------------- Pages ----------------
     def _build_dashboard_page(self, parent: ctk.CTkFrame) -> ctk.CTkFrame:
@@ -343,12 +915,12 @@ class HTSMSApp(ctk.CTk):
         ctk.CTkLabel(toolbar, text="Search").grid(row=0, column=0, padx=(12, 6), pady=12)
         self.student_search = ctk.CTkEntry(toolbar, placeholder_text="name, ID, class, section, contact")
         self.student_search.grid(row=0, column=1, padx=6, pady=12, sticky="ew")
-        self.student_search.bind("<KeyRelease>", lambda _e: self._debounce("student_search", 180, self.refresh_students))
+        self.student_search.bind("<KeyRelease>", lambda _e: self._debounce("students", _SEARCH_DEBOUNCE_MS, self.refresh_students))
 
         ctk.CTkLabel(toolbar, text="Class").grid(row=0, column=2, padx=(12, 6), pady=12)
         self.student_class_filter = ctk.CTkEntry(toolbar, placeholder_text="e.g. 10", width=120)
         self.student_class_filter.grid(row=0, column=3, padx=6, pady=12)
-        self.student_class_filter.bind("<KeyRelease>", lambda _e: self._debounce("student_filter", 180, self.refresh_students))
+        self.student_class_filter.bind("<KeyRelease>", lambda _e: self._debounce("students", _SEARCH_DEBOUNCE_MS, self.refresh_students))
 
         ctk.CTkButton(toolbar, text="Add", command=self.add_student).grid(row=0, column=4, padx=(12, 6), pady=12)
         ctk.CTkButton(toolbar, text="Refresh", command=self.refresh_students).grid(row=0, column=5, padx=6, pady=12)
@@ -373,7 +945,7 @@ class HTSMSApp(ctk.CTk):
 
         self.students_tree = self._make_students_tree(left)
         self.students_tree.grid(row=1, column=0, sticky="nsew", padx=12, pady=(0, 12))
-        self.students_tree.bind("<<TreeviewSelect>>", self._on_student_selected)
+        self.students_tree.bind("<<TreeviewSelect>>", self._on_student_selected, add="+")
 
         right = ctk.CTkFrame(body, corner_radius=0)
         right.grid(row=0, column=1, sticky="ns", padx=(12, 0), pady=0)
@@ -431,7 +1003,7 @@ class HTSMSApp(ctk.CTk):
         ctk.CTkLabel(toolbar, text="Search").grid(row=0, column=0, padx=(12, 6), pady=12)
         self.teacher_search = ctk.CTkEntry(toolbar, placeholder_text="name, ID, role, contact")
         self.teacher_search.grid(row=0, column=1, padx=6, pady=12, sticky="ew")
-        self.teacher_search.bind("<KeyRelease>", lambda _e: self._debounce("teacher_search", 180, self.refresh_teachers))
+        self.teacher_search.bind("<KeyRelease>", lambda _e: self._debounce("teachers", _SEARCH_DEBOUNCE_MS, self.refresh_teachers))
 
         ctk.CTkButton(toolbar, text="Add", command=self.add_teacher).grid(row=0, column=2, padx=(12, 6), pady=12)
         ctk.CTkButton(toolbar, text="Refresh", command=self.refresh_teachers).grid(row=0, column=3, padx=6, pady=12)
@@ -456,7 +1028,7 @@ class HTSMSApp(ctk.CTk):
 
         self.teachers_tree = self._make_teachers_tree(left)
         self.teachers_tree.grid(row=1, column=0, sticky="nsew", padx=12, pady=(0, 12))
-        self.teachers_tree.bind("<<TreeviewSelect>>", self._on_teacher_selected)
+        self.teachers_tree.bind("<<TreeviewSelect>>", self._on_teacher_selected, add="+")
 
         right = ctk.CTkFrame(body, corner_radius=0)
         right.grid(row=0, column=1, sticky="ns", padx=(12, 0), pady=0)
@@ -513,7 +1085,7 @@ class HTSMSApp(ctk.CTk):
         ctk.CTkLabel(toolbar, text="Search").grid(row=0, column=0, padx=(12, 6), pady=12)
         self.activity_search = ctk.CTkEntry(toolbar, placeholder_text="action, entity, details")
         self.activity_search.grid(row=0, column=1, padx=6, pady=12, sticky="ew")
-        self.activity_search.bind("<KeyRelease>", lambda _e: self._debounce("activity_search", 180, self.refresh_activity))
+        self.activity_search.bind("<KeyRelease>", lambda _e: self._debounce("activity", _SEARCH_DEBOUNCE_MS, self.refresh_activity))
         ctk.CTkButton(toolbar, text="Refresh", command=self.refresh_activity).grid(row=0, column=2, padx=12, pady=12)
 
         body = self._card(page)
@@ -574,9 +1146,7 @@ class HTSMSApp(ctk.CTk):
         self.student_cf_entry.grid(row=0, column=0, padx=(0, 8), pady=0, sticky="ew")
         ctk.CTkButton(row, text="Add", width=90, command=self.add_student_custom_field).grid(row=0, column=1)
 
-        self.student_cf_list = ctk.CTkScrollableFrame(s_box)
-        self.student_cf_list.grid(row=2, column=0, padx=14, pady=(6, 14), sticky="nsew")
-        self.student_cf_list.grid_columnconfigure(0, weight=1)
+        self.student_cf_list = self._make_fields_tree(s_box, self.remove_student_custom_field)
 
         t_box = self._card(body)
         t_box.grid(row=0, column=1, sticky="nsew", padx=(10, 0), pady=0)
@@ -593,9 +1163,7 @@ class HTSMSApp(ctk.CTk):
         self.teacher_cf_entry.grid(row=0, column=0, padx=(0, 8), pady=0, sticky="ew")
         ctk.CTkButton(row, text="Add", width=90, command=self.add_teacher_custom_field).grid(row=0, column=1)
 
-        self.teacher_cf_list = ctk.CTkScrollableFrame(t_box)
-        self.teacher_cf_list.grid(row=2, column=0, padx=14, pady=(6, 14), sticky="nsew")
-        self.teacher_cf_list.grid_columnconfigure(0, weight=1)
+        self.teacher_cf_list = self._make_fields_tree(t_box, self.remove_teacher_custom_field)
 
         return page
 
@@ -606,10 +1174,39 @@ class HTSMSApp(ctk.CTk):
         wrap.grid_rowconfigure(0, weight=1)
         return wrap
 
+    def _make_fields_tree(self, parent: ctk.CTkFrame, on_remove: Callable[[str], None]) -> ttk.Treeview:
+        # One Treeview instead of a frame + label + button per field.
+        wrap = self._wrap_tree(parent)
+        tree = ttk.Treeview(wrap, columns=("name", "remove"), show="headings", selectmode="browse", height=10)
+        tree.heading("name", text="Field")
+        tree.heading("remove", text="")
+        tree.column("name", width=220, anchor="w")
+        tree.column("remove", width=90, stretch=False, anchor="center")
+        vsb = ttk.Scrollbar(wrap, orient="vertical", command=tree.yview)
+        tree.configure(yscrollcommand=vsb.set)
+        tree.grid(row=0, column=0, sticky="nsew")
+        vsb.grid(row=0, column=1, sticky="ns")
+        wrap.grid(row=2, column=0, padx=14, pady=(6, 14), sticky="nsew")
+
+        def on_click(event) -> None:
+            iid = tree.identify_row(event.y)
+            if iid and tree.identify_column(event.x) == "#2":
+                on_remove(iid)
+
+        def on_delete(_event) -> None:
+            sel = tree.selection()
+            if sel:
+                on_remove(sel[0])
+
+        tree.bind("<Button-1>", on_click, add="+")
+        tree.bind("<Delete>", on_delete)
+        return tree
+
     def _make_students_tree(self, parent: ctk.CTkFrame) -> ttk.Treeview:
         wrap = self._wrap_tree(parent)
-        columns = ("id", "name", "class", "section", "primary", "secondary")
-        tree = ttk.Treeview(wrap, columns=columns, show="headings", selectmode="browse")
+        tree = ttk.Treeview(
+            wrap, columns=_STUDENT_COLUMNS + _CF_COLUMNS, displaycolumns=_STUDENT_COLUMNS, show="headings", selectmode="browse"
+        )
         tree.heading("id", text="ID")
         tree.heading("name", text="Name")
         tree.heading("class", text="Class")
@@ -622,17 +1219,32 @@ class HTSMSApp(ctk.CTk):
         tree.column("section", width=80, anchor="w")
         tree.column("primary", width=180, anchor="w")
         tree.column("secondary", width=180, anchor="w")
-        vsb = ttk.Scrollbar(wrap, orient="vertical", command=tree.yview)
-        tree.configure(yscrollcommand=vsb.set)
+        for cf in _CF_COLUMNS:
+            tree.column(cf, width=140, anchor="w")
+        vsb = ttk.Scrollbar(wrap, orient="vertical")
+        self.students_view = _TreeWindow(tree, vsb)
         tree.grid(row=0, column=0, sticky="nsew")
         vsb.grid(row=0, column=1, sticky="ns")
         wrap.grid(row=1, column=0, sticky="nsew")
         return tree
 
+    def _sync_custom_columns(self) -> None:
+        for key, tree, base, fields in (
+            ("students", getattr(self, "students_tree", None), _STUDENT_COLUMNS, self.settings.student_custom_fields),
+            ("teachers", getattr(self, "teachers_tree", None), _TEACHER_COLUMNS, self.settings.teacher_custom_fields),
+        ):
+            if key not in self._pages or tree is None:
+                continue
+            active = _CF_COLUMNS[: min(len(fields), MAX_CUSTOM_COLUMNS)]
+            for col, name in zip(active, fields):
+                tree.heading(col, text=name)
+            tree.configure(displaycolumns=base + active)
+
     def _make_teachers_tree(self, parent: ctk.CTkFrame) -> ttk.Treeview:
         wrap = self._wrap_tree(parent)
-        columns = ("id", "name", "role", "primary", "secondary")
-        tree = ttk.Treeview(wrap, columns=columns, show="headings", selectmode="browse")
+        tree = ttk.Treeview(
+            wrap, columns=_TEACHER_COLUMNS + _CF_COLUMNS, displaycolumns=_TEACHER_COLUMNS, show="headings", selectmode="browse"
+        )
         tree.heading("id", text="ID")
         tree.heading("name", text="Name")
         tree.heading("role", text="Role")
@@ -643,8 +1255,10 @@ class HTSMSApp(ctk.CTk):
         tree.column("role", width=180, anchor="w")
         tree.column("primary", width=180, anchor="w")
         tree.column("secondary", width=180, anchor="w")
-        vsb = ttk.Scrollbar(wrap, orient="vertical", command=tree.yview)
-        tree.configure(yscrollcommand=vsb.set)
+        for cf in _CF_COLUMNS:
+            tree.column(cf, width=140, anchor="w")
+        vsb = ttk.Scrollbar(wrap, orient="vertical")
+        self.teachers_view = _TreeWindow(tree, vsb)
         tree.grid(row=0, column=0, sticky="nsew")
         vsb.grid(row=0, column=1, sticky="ns")
         wrap.grid(row=1, column=0, sticky="nsew")
@@ -662,190 +1276,190 @@ class HTSMSApp(ctk.CTk):
         tree.column("action", width=140, anchor="w")
         tree.column("entity", width=160, anchor="w")
         tree.column("details", width=600, anchor="w")
-        vsb = ttk.Scrollbar(wrap, orient="vertical", command=tree.yview)
-        tree.configure(yscrollcommand=vsb.set)
+        vsb = ttk.Scrollbar(wrap, orient="vertical")
+        self.activity_view = _TreeWindow(tree, vsb)
         tree.grid(row=0, column=0, sticky="nsew")
         vsb.grid(row=0, column=1, sticky="ns")
         wrap.grid(row=0, column=0, sticky="nsew")
         return tree
 
     # ---------------- Data refresh ----------------
-    def refresh_all(self) -> None:
+    def _load_page_defaults(self, key: str) -> None:
         # Month / year defaults
-        self.dash_month.set(MONTHS[self.settings.default_month - 1])
-        self.dash_year.delete(0, "end")
-        self.dash_year.insert(0, str(self.settings.default_year))
-
-        self.student_month.set(MONTHS[self.settings.default_month - 1])
-        self.student_year.delete(0, "end")
-        self.student_year.insert(0, str(self.settings.default_year))
-
-        self.teacher_month.set(MONTHS[self.settings.default_month - 1])
-        self.teacher_year.delete(0, "end")
-        self.teacher_year.insert(0, str(self.settings.default_year))
-
-        # Settings values
-        self.student_prefix.delete(0, "end")
-        self.student_prefix.insert(0, self.settings.student_id_prefix)
-        self.teacher_prefix.delete(0, "end")
-        self.teacher_prefix.insert(0, self.settings.teacher_id_prefix)
-        self.appearance_mode.set((self.settings.appearance_mode or "System").capitalize())
-        self.ui_scale.set(str(getattr(self.settings, "ui_scaling", 1.0)))
-
-        self.refresh_students()
-        self.refresh_teachers()
-        self.refresh_dashboard()
-        self.refresh_activity()
-        self.refresh_custom_fields_views()
+        if key == "dashboard":
+            self.dash_month.set(MONTHS[self.settings.default_month - 1])
+            self.dash_year.delete(0, "end")
+            self.dash_year.insert(0, str(self.settings.default_year))
+        elif key == "students":
+            self.student_month.set(MONTHS[self.settings.default_month - 1])
+            self.student_year.delete(0, "end")
+            self.student_year.insert(0, str(self.settings.default_year))
+            self._sync_custom_columns()
+        elif key == "teachers":
+            self.teacher_month.set(MONTHS[self.settings.default_month - 1])
+            self.teacher_year.delete(0, "end")
+            self.teacher_year.insert(0, str(self.settings.default_year))
+            self._sync_custom_columns()
+        elif key == "settings":
+            self.student_prefix.delete(0, "end")
+            self.student_prefix.insert(0, self.settings.student_id_prefix)
+            self.teacher_prefix.delete(0, "end")
+            self.teacher_prefix.insert(0, self.settings.teacher_id_prefix)
+            self.appearance_mode.set((self.settings.appearance_mode or "System").capitalize())
+            self.ui_scale.set(str(self.settings.ui_scaling))
+
+    def _request_refresh(self, flags: int) -> None:
+        if not self._pending_refresh:
+            self.after_idle(self._run_pending_refresh)
+        self._pending_refresh |= flags
+
+    def _run_pending_refresh(self) -> None:
+        # Only the visible page is refreshed; hidden ones are caught up by show_page
+        # when their freshness stamp no longer matches.
+        flags, self._pending_refresh = self._pending_refresh, 0
+        flags &= _PAGE_REFRESH.get(self._active_page or "", 0)
+        if flags & _R_STUDENTS:
+            self._spawn(self._refresh_students(), "refresh_students")
+        if flags & _R_TEACHERS:
+            self._spawn(self._refresh_teachers(), "refresh_teachers")
+        if flags & _R_DASHBOARD:
+            self._spawn(self._refresh_dashboard(), "refresh_dashboard")
+        if flags & _R_ACTIVITY:
+            self._spawn(self._refresh_activity(), "refresh_activity")
 
     def _month_index(self, month_name: str) -> int:
-        try:
-            return MONTHS.index(month_name) + 1
-        except ValueError:
-            return self.settings.default_month
+        return _MONTH_INDEX.get(month_name, self.settings.default_month)
 
     def _emit(self, action: str, entity_type: str, entity_id: str, details: str = "") -> None:
-        self.store.add_event(AppEvent(timestamp=now_ts(), action=action, entity_type=entity_type, entity_id=entity_id, details=details))
+        event = AppEvent(timestamp=now_ts(), action=action, entity_type=entity_type, entity_id=entity_id, details=details)
+        self._submit("add_event", self.store.add_event, event)
+        self._mark_dirty("activity")
 
     def refresh_students(self) -> None:
+        self._request_refresh(_R_STUDENTS)
+
+    async def _refresh_students(self) -> None:
         try:
-            data = self.store.list_students()
-            q = (self.student_search.get() or "").strip().lower()
-            class_filter = (self.student_class_filter.get() or "").strip().lower()
-
-            filtered = []
-            for r in data:
-                if class_filter and str(r.get("class", "")).strip().lower() != class_filter:
-                    continue
-                if q:
-                    blob = " ".join(
-                        [
-                            str(r.get("student_id", "")),
-                            str(r.get("first_name", "")),
-                            str(r.get("last_name", "")),
-                            str(r.get("class", "")),
-                            str(r.get("section", "")),
-                            str(r.get("primary_contact", "")),
-                            str(r.get("secondary_contact", "")),
-                        ]
-                    ).lower()
-                    if q not in blob:
-                        continue
-                filtered.append(r)
-
-            filtered.sort(key=lambda r: str(r.get("student_id", "")))
-
-            for item in self.students_tree.get_children(""):
-                self.students_tree.delete(item)
-
-            for r in filtered:
-                sid = str(r.get("student_id", ""))
-                name = f"{r.get('first_name','')} {r.get('last_name','')}".strip()
-                cls = str(r.get("class", ""))
-                sec = str(r.get("section", ""))
-                primary = str(r.get("primary_contact", ""))
-                secondary = str(r.get("secondary_contact", ""))
-                if not sid:
-                    continue
-                self.students_tree.insert("", "end", iid=sid, values=(sid, name, cls, sec, primary, secondary))
-
-            self.students_count.configure(text=f"{len(filtered)} records")
+            self._student_index = idx = await self._io(
+                self._current_index, "student", self._student_index, tuple(self.settings.student_custom_fields)
+            )
+            q = _search_text(self.student_search)
+            class_filter = _search_text(self.student_class_filter)
+
+            hits = idx.filter(q, class_filter)
+            self.students_view.set_rows([idx.ids[i] for i in hits], [idx.rows[i] for i in hits])
+
+            self.students_count.configure(text=f"{len(hits)} records")
+            self._freshness["students"] = (idx.version, idx.fields)
 
             if self.selected.entity == "student" and self.selected.person_id:
-                if self.selected.person_id in self.students_tree.get_children(""):
-                    self.students_tree.selection_set(self.selected.person_id)
+                if self.students_view.contains(self.selected.person_id):
+                    self.students_view.select(self.selected.person_id)
                 self._update_student_payment_label()
         except Exception as e:
             self.err_logger.log_exception(e, "refresh_students")
 
+    def _current_index(self, entity: str, idx: _PersonIndex, fields: tuple[str, ...]) -> _PersonIndex:
+        # Runs on the I/O worker; only re-reads the sheet when the store (or the
+        # set of custom-field columns) changed.
+        version = self.store.version
+        if idx.version == version and idx.fields == fields:
+            return idx
+        if entity == "student":
+            return _build_student_index(self.store.list_students(), version, fields, self._student_blob_cache)
+        return _build_teacher_index(self.store.list_teachers(), version, fields, self._teacher_blob_cache)
+
     def refresh_teachers(self) -> None:
+        self._request_refresh(_R_TEACHERS)
+
+    async def _refresh_teachers(self) -> None:
         try:
-            data = self.store.list_teachers()
-            q = (self.teacher_search.get() or "").strip().lower()
-            filtered = []
-            for r in data:
-                if q:
-                    blob = " ".join(
-                        [
-                            str(r.get("teacher_id", "")),
-                            str(r.get("first_name", "")),
-                            str(r.get("last_name", "")),
-                            str(r.get("role", "")),
-                            str(r.get("primary_contact", "")),
-                            str(r.get("secondary_contact", "")),
-                        ]
-                    ).lower()
-                    if q not in blob:
-                        continue
-                filtered.append(r)
-
-            filtered.sort(key=lambda r: str(r.get("teacher_id", "")))
-
-            for item in self.teachers_tree.get_children(""):
-                self.teachers_tree.delete(item)
-
-            for r in filtered:
-                tid = str(r.get("teacher_id", ""))
-                name = f"{r.get('first_name','')} {r.get('last_name','')}".strip()
-                role = str(r.get("role", ""))
-                primary = str(r.get("primary_contact", ""))
-                secondary = str(r.get("secondary_contact", ""))
-                if not tid:
-                    continue
-                self.teachers_tree.insert("", "end", iid=tid, values=(tid, name, role, primary, secondary))
-
-            self.teachers_count.configure(text=f"{len(filtered)} records")
+            self._teacher_index = idx = await self._io(
+                self._current_index, "teacher", self._teacher_index, tuple(self.settings.teacher_custom_fields)
+            )
+            q = _search_text(self.teacher_search)
+
+            hits = idx.filter(q)
+            self.teachers_view.set_rows([idx.ids[i] for i in hits], [idx.rows[i] for i in hits])
+
+            self.teachers_count.configure(text=f"{len(hits)} records")
+            self._freshness["teachers"] = (idx.version, idx.fields)
 
             if self.selected.entity == "teacher" and self.selected.person_id:
-                if self.selected.person_id in self.teachers_tree.get_children(""):
-                    self.teachers_tree.selection_set(self.selected.person_id)
+                if self.teachers_view.contains(self.selected.person_id):
+                    self.teachers_view.select(self.selected.person_id)
                 self._update_teacher_payment_label()
         except Exception as e:
             self.err_logger.log_exception(e, "refresh_teachers")
 
+    def _activity_snapshot(self, log: _ActivityLog) -> _ActivityLog:
+        # Runs on the I/O worker. Events are only ever appended, so unless the store
+        # reloaded its log we just fetch what came after our newest timestamp.
+        store = self.store
+        if log.version == store.version:
+            return log
+        version, epoch = store.version, store.events_epoch
+        if epoch == log.epoch and log.events:
+            last_ts = str(log.events[0].get("timestamp") or "")
+            fresh = store.list_events_desc(ACTIVITY_LIMIT, since_ts=last_ts)
+            if len(fresh) < ACTIVITY_LIMIT:
+                # fresh ends with the events stamped last_ts, some of which we already hold.
+                known = 0
+                for ev in log.events:
+                    if str(ev.get("timestamp") or "") != last_ts:
+                        break
+                    known += 1
+                fresh = fresh[: len(fresh) - known]
+                built = [_activity_row(ev) for ev in fresh]
+                return _ActivityLog(
+                    version,
+                    epoch,
+                    log.top + len(fresh),
+                    (fresh + log.events)[:ACTIVITY_LIMIT],
+                    ([b for _, b in built] + log.blobs)[:ACTIVITY_LIMIT],
+                    ([r for r, _ in built] + log.rows)[:ACTIVITY_LIMIT],
+                )
+        events = store.list_events_desc(ACTIVITY_LIMIT)
+        built = [_activity_row(ev) for ev in events]
+        return _ActivityLog(
+            version,
+            epoch,
+            log.top + len(events),
+            events,
+            [b for _, b in built],
+            [r for r, _ in built],
+        )
+
     def refresh_activity(self) -> None:
+        self._request_refresh(_R_ACTIVITY)
+
+    async def _refresh_activity(self) -> None:
         try:
-            q = (self.activity_search.get() or "").strip().lower()
-            events = self.store.list_events(limit=700)
+            log = self._activity_log = await self._io(self._activity_snapshot, self._activity_log)
+            q = _search_text(self.activity_search)
             if q:
-                filtered = []
-                for ev in events:
-                    blob = " ".join(
-                        [
-                            str(ev.get("timestamp", "")),
-                            str(ev.get("action", "")),
-                            str(ev.get("entity_type", "")),
-                            str(ev.get("entity_id", "")),
-                            str(ev.get("details", "")),
-                        ]
-                    ).lower()
-                    if q in blob:
-                        filtered.append(ev)
-                events = filtered
-
-            for item in self.activity_tree.get_children(""):
-                self.activity_tree.delete(item)
-
-            # Newest first
-            for ev in reversed(events):
-                ts = str(ev.get("timestamp", ""))
-                action = str(ev.get("action", ""))
-                entity = f"{ev.get('entity_type','')}:{ev.get('entity_id','')}"
-                details = str(ev.get("details", ""))
-                self.activity_tree.insert("", "end", values=(ts, action, entity, details))
+                hits = [i for i, blob in enumerate(log.blobs) if q in blob]
+                self.activity_view.set_rows([log.iid(i) for i in hits], [log.rows[i] for i in hits])
+            else:
+                self.activity_view.set_rows([log.iid(i) for i in range(len(log.rows))], log.rows)
+            self._freshness["activity"] = (log.version,)
         except Exception as e:
             self.err_logger.log_exception(e, "refresh_activity")
 
     # ---------------- Selection handlers ----------------
     def _on_student_selected(self, _event=None) -> None:
         sel = self.students_tree.selection()
-        if not sel:
+        # _TreeWindow.render re-selects the row whenever it scrolls back into view;
+        # that isn't a new selection and mustn't re-read the payment status.
+        if not sel or (self.selected.entity == "student" and self.selected.person_id == sel[0]):
             return
         self.select_student(sel[0])
 
     def _on_teacher_selected(self, _event=None) -> None:
         sel = self.teachers_tree.selection()
-        if not sel:
+        # _TreeWindow.render re-selects the row whenever it scrolls back into view;
+        # that isn't a new selection and mustn't re-read the payment status.
+        if not sel or (self.selected.entity == "teacher" and self.selected.person_id == sel[0]):
             return
         self.select_teacher(sel[0])
 
@@ -863,8 +1477,10 @@ class HTSMSApp(ctk.CTk):
             return
         year = _safe_int(self.student_year.get(), self.settings.default_year)
         month = self._month_index(self.student_month.get())
-        status = self.store.get_payment_status("student", self.selected.person_id, year, month)
-        self.student_payment_status.configure(text=f"Status: {status}  ({MONTHS[month-1]} {year})")
+        self._spawn(
+            self._show_payment_status(self.student_payment_status, "student", self.selected.person_id, year, month),
+            "_update_student_payment_label",
+        )
 
     def _update_teacher_payment_label(self) -> None:
         if self.selected.entity != "teacher" or not self.selected.person_id:
@@ -872,11 +1488,18 @@ class HTSMSApp(ctk.CTk):
             return
         year = _safe_int(self.teacher_year.get(), self.settings.default_year)
         month = self._month_index(self.teacher_month.get())
-        status = self.store.get_payment_status("teacher", self.selected.person_id, year, month)
-        self.teacher_payment_status.configure(text=f"Status: {status}  ({MONTHS[month-1]} {year})")
+        self._spawn(
+            self._show_payment_status(self.teacher_payment_status, "teacher", self.selected.person_id, year, month),
+            "_update_teacher_payment_label",
+        )
+
+    async def _show_payment_status(self, label: ctk.CTkLabel, entity: str, person_id: str, year: int, month: int) -> None:
+        status = await self._io(self.store.get_payment_status, entity, person_id, year, month)
+        if self.selected.entity == entity and self.selected.person_id == person_id:
+            label.configure(text=f"Status: {status}  ({MONTHS[month-1]} {year})")
 
     # ---------------- CRUD dialogs ----------------
-    def _person_dialog(self, title: str, fields: list[tuple[str, str]], custom_fields: list[str], initial: dict[str, str] | None = None):
+    def _person_dialog(self, title: str, fields: list[tuple[str, str]], custom_fields: Sequence[str], initial: dict[str, str] | None = None):
         dlg = ctk.CTkToplevel(self)
         dlg.title(title)
         dlg.geometry("620x680")
@@ -942,23 +1565,15 @@ class HTSMSApp(ctk.CTk):
         self.wait_window(dlg)
         return result if result else None
 
-    def _next_id(self, entity: str, prefix: str, existing_ids: list[str]) -> str:
-        max_n = 0
-        for eid in existing_ids:
-            if not eid.startswith(prefix):
-                continue
-            tail = eid[len(prefix) :]
-            m = re.match(r"0*(\d+)$", tail)
-            if m:
-                max_n = max(max_n, int(m.group(1)))
-        return f"{prefix}{max_n + 1:04d}"
-
     # ---------------- Actions (Students/Teachers) ----------------
     def add_student(self) -> None:
+        self._spawn(
+            self._io_then(self._add_student_dialog, self.store.next_student_id, self.settings.student_id_prefix),
+            "add_student",
+        )
+
+    def _add_student_dialog(self, sid: str) -> None:
         try:
-            students = self.store.list_students()
-            existing = [str(s.get("student_id", "")) for s in students]
-            sid = self._next_id("student", self.settings.student_id_prefix, existing)
 
             fields = [
                 ("student_id", "Student ID"),
@@ -973,31 +1588,33 @@ class HTSMSApp(ctk.CTk):
             res = self._person_dialog("Add Student", fields, self.settings.student_custom_fields, initial=initial)
             if not res:
                 return
-            self.store.upsert_student(res)
+            self._submit("upsert_student", self.store.upsert_student, res)
+            self._student_blob_cache.pop(res.get("student_id", ""), None)
+            self._mark_dirty("students")
             self._emit(
                 "add_student",
                 "student",
                 res.get("student_id", ""),
                 f"{res.get('first_name','')} {res.get('last_name','')}",
             )
-            self.refresh_students()
-            self.refresh_dashboard()
-            self.refresh_activity()
+            self._request_refresh(_R_STUDENTS | _R_DASHBOARD | _R_ACTIVITY)
         except Exception as e:
             self.err_logger.log_exception(e, "add_student")
 
     def edit_selected_student(self) -> None:
         if self.selected.entity != "student" or not self.selected.person_id:
             return
+        person_id = self.selected.person_id
+        self._spawn(
+            self._io_then(functools.partial(self._edit_student_dialog, person_id), self.store.get_student, person_id),
+            "edit_selected_student",
+        )
+
+    def _edit_student_dialog(self, person_id: str, record: dict[str, Any] | None) -> None:
         try:
-            students = self.store.list_students()
-            current = None
-            for s in students:
-                if str(s.get("student_id", "")) == self.selected.person_id:
-                    current = {k: "" if v is None else str(v) for k, v in s.items()}
-                    break
-            if not current:
+            if not record:
                 return
+            current = {k: "" if v is None else str(v) for k, v in record.items()}
 
             fields = [
                 ("student_id", "Student ID"),
@@ -1012,12 +1629,12 @@ class HTSMSApp(ctk.CTk):
             res = self._person_dialog("Edit Student", fields, self.settings.student_custom_fields, initial=current)
             if not res:
                 return
-            res["student_id"] = self.selected.person_id
-            self.store.upsert_student(res)
-            self._emit("edit_student", "student", self.selected.person_id, "updated profile")
-            self.refresh_students()
-            self.refresh_dashboard()
-            self.refresh_activity()
+            res["student_id"] = person_id
+            self._submit("upsert_student", self.store.upsert_student, res)
+            self._student_blob_cache.pop(person_id, None)
+            self._mark_dirty("students")
+            self._emit("edit_student", "student", person_id, "updated profile")
+            self._request_refresh(_R_STUDENTS | _R_DASHBOARD | _R_ACTIVITY)
         except Exception as e:
             self.err_logger.log_exception(e, "edit_selected_student")
 
@@ -1025,22 +1642,23 @@ class HTSMSApp(ctk.CTk):
         if self.selected.entity != "student" or not self.selected.person_id:
             return
         try:
-            ok = self.store.delete_student(self.selected.person_id)
-            if ok:
-                self._emit("delete_student", "student", self.selected.person_id, "deleted")
+            self._submit("delete_student", self._delete_person, "student", self.selected.person_id)
+            self._student_blob_cache.pop(self.selected.person_id, None)
+            self._mark_dirty("students")
             self.selected = Selected()
             self.student_payment_status.configure(text="Status: (select a student)")
-            self.refresh_students()
-            self.refresh_dashboard()
-            self.refresh_activity()
+            self._request_refresh(_R_STUDENTS | _R_DASHBOARD | _R_ACTIVITY)
         except Exception as e:
             self.err_logger.log_exception(e, "delete_selected_student")
 
     def add_teacher(self) -> None:
+        self._spawn(
+            self._io_then(self._add_teacher_dialog, self.store.next_teacher_id, self.settings.teacher_id_prefix),
+            "add_teacher",
+        )
+
+    def _add_teacher_dialog(self, tid: str) -> None:
         try:
-            teachers = self.store.list_teachers()
-            existing = [str(t.get("teacher_id", "")) for t in teachers]
-            tid = self._next_id("teacher", self.settings.teacher_id_prefix, existing)
 
             fields = [
                 ("teacher_id", "Teacher ID"),
@@ -1054,31 +1672,33 @@ class HTSMSApp(ctk.CTk):
             res = self._person_dialog("Add Teacher", fields, self.settings.teacher_custom_fields, initial=initial)
             if not res:
                 return
-            self.store.upsert_teacher(res)
+            self._submit("upsert_teacher", self.store.upsert_teacher, res)
+            self._teacher_blob_cache.pop(res.get("teacher_id", ""), None)
+            self._mark_dirty("teachers")
             self._emit(
                 "add_teacher",
                 "teacher",
                 res.get("teacher_id", ""),
                 f"{res.get('first_name','')} {res.get('last_name','')}",
             )
-            self.refresh_teachers()
-            self.refresh_dashboard()
-            self.refresh_activity()
+            self._request_refresh(_R_TEACHERS | _R_DASHBOARD | _R_ACTIVITY)
         except Exception as e:
             self.err_logger.log_exception(e, "add_teacher")
 
     def edit_selected_teacher(self) -> None:
         if self.selected.entity != "teacher" or not self.selected.person_id:
             return
+        person_id = self.selected.person_id
+        self._spawn(
+            self._io_then(functools.partial(self._edit_teacher_dialog, person_id), self.store.get_teacher, person_id),
+            "edit_selected_teacher",
+        )
+
+    def _edit_teacher_dialog(self, person_id: str, record: dict[str, Any] | None) -> None:
         try:
-            teachers = self.store.list_teachers()
-            current = None
-            for t in teachers:
-                if str(t.get("teacher_id", "")) == self.selected.person_id:
-                    current = {k: "" if v is None else str(v) for k, v in t.items()}
-                    break
-            if not current:
+            if not record:
                 return
+            current = {k: "" if v is None else str(v) for k, v in record.items()}
 
             fields = [
                 ("teacher_id", "Teacher ID"),
@@ -1091,12 +1711,12 @@ class HTSMSApp(ctk.CTk):
             res = self._person_dialog("Edit Teacher", fields, self.settings.teacher_custom_fields, initial=current)
             if not res:
                 return
-            res["teacher_id"] = self.selected.person_id
-            self.store.upsert_teacher(res)
-            self._emit("edit_teacher", "teacher", self.selected.person_id, "updated profile")
-            self.refresh_teachers()
-            self.refresh_dashboard()
-            self.refresh_activity()
+            res["teacher_id"] = person_id
+            self._submit("upsert_teacher", self.store.upsert_teacher, res)
+            self._teacher_blob_cache.pop(person_id, None)
+            self._mark_dirty("teachers")
+            self._emit("edit_teacher", "teacher", person_id, "updated profile")
+            self._request_refresh(_R_TEACHERS | _R_DASHBOARD | _R_ACTIVITY)
         except Exception as e:
             self.err_logger.log_exception(e, "edit_selected_teacher")
 
@@ -1104,97 +1724,109 @@ class HTSMSApp(ctk.CTk):
         if self.selected.entity != "teacher" or not self.selected.person_id:
             return
         try:
-            ok = self.store.delete_teacher(self.selected.person_id)
-            if ok:
-                self._emit("delete_teacher", "teacher", self.selected.person_id, "deleted")
+            self._submit("delete_teacher", self._delete_person, "teacher", self.selected.person_id)
+            self._teacher_blob_cache.pop(self.selected.person_id, None)
+            self._mark_dirty("teachers")
             self.selected = Selected()
             self.teacher_payment_status.configure(text="Status: (select a teacher)")
-            self.refresh_teachers()
-            self.refresh_dashboard()
-            self.refresh_activity()
+            self._request_refresh(_R_TEACHERS | _R_DASHBOARD | _R_ACTIVITY)
         except Exception as e:
             self.err_logger.log_exception(e, "delete_selected_teacher")
 
+    def _delete_person(self, entity: str, person_id: str) -> None:
+        # Runs on the I/O worker: only log the event if a row was actually removed.
+        delete = self.store.delete_student if entity == "student" else self.store.delete_teacher
+        if delete(person_id):
+            self.store.add_event(
+                AppEvent(timestamp=now_ts(), action=f"delete_{entity}", entity_type=entity, entity_id=person_id, details="deleted")
+            )
+
     # ---------------- Payments ----------------
     def toggle_student_payment(self) -> None:
         if self.selected.entity != "student" or not self.selected.person_id:
             return
-        try:
-            year = _safe_int(self.student_year.get(), self.settings.default_year)
-            month = self._month_index(self.student_month.get())
-            current = self.store.get_payment_status("student", self.selected.person_id, year, month)
-            new_status = "Pending" if current.lower() == "paid" else "Paid"
-            self.store.set_payment_status("student", self.selected.person_id, year, month, new_status)
-            self._emit("toggle_tuition", "student", self.selected.person_id, f"{MONTHS[month-1]} {year}: {new_status}")
-            self._update_student_payment_label()
-            self.refresh_dashboard()
-            self.refresh_activity()
-        except Exception as e:
-            self.err_logger.log_exception(e, "toggle_student_payment")
+        year = _safe_int(self.student_year.get(), self.settings.default_year)
+        month = self._month_index(self.student_month.get())
+        self._spawn(
+            self._toggle_payment("student", "toggle_tuition", self.selected.person_id, year, month),
+            "toggle_student_payment",
+        )
 
     def toggle_teacher_payment(self) -> None:
         if self.selected.entity != "teacher" or not self.selected.person_id:
             return
+        year = _safe_int(self.teacher_year.get(), self.settings.default_year)
+        month = self._month_index(self.teacher_month.get())
+        self._spawn(
+            self._toggle_payment("teacher", "toggle_salary", self.selected.person_id, year, month),
+            "toggle_teacher_payment",
+        )
+
+    async def _toggle_payment(self, entity: str, action: str, person_id: str, year: int, month: int) -> None:
         try:
-            year = _safe_int(self.teacher_year.get(), self.settings.default_year)
-            month = self._month_index(self.teacher_month.get())
-            current = self.store.get_payment_status("teacher", self.selected.person_id, year, month)
-            new_status = "Pending" if current.lower() == "paid" else "Paid"
-            self.store.set_payment_status("teacher", self.selected.person_id, year, month, new_status)
-            self._emit("toggle_salary", "teacher", self.selected.person_id, f"{MONTHS[month-1]} {year}: {new_status}")
-            self._update_teacher_payment_label()
-            self.refresh_dashboard()
-            self.refresh_activity()
+            new_status = await self._io(self._flip_payment_status, entity, person_id, year, month)
+            self._mark_dirty("payments")
+            self._emit(action, entity, person_id, f"{MONTHS[month-1]} {year}: {new_status}")
+            if entity == "student":
+                self._update_student_payment_label()
+            else:
+                self._update_teacher_payment_label()
+            self._request_refresh(_R_DASHBOARD | _R_ACTIVITY)
         except Exception as e:
-            self.err_logger.log_exception(e, "toggle_teacher_payment")
+            self.err_logger.log_exception(e, f"toggle_{entity}_payment")
+
+    def _flip_payment_status(self, entity: str, person_id: str, year: int, month: int) -> str:
+        # Runs on the I/O worker so the read and the write stay back-to-back.
+        current = self.store.get_payment_status(entity, person_id, year, month)
+        new_status = "Pending" if current.lower() == "paid" else "Paid"
+        self.store.set_payment_status(entity, person_id, year, month, new_status)
+        return new_status
 
     # ---------------- Dashboard ----------------
     def refresh_dashboard(self) -> None:
+        self._request_refresh(_R_DASHBOARD)
+
+    def _dashboard_snapshot(self, year: int, month: int):
+        # Runs on the I/O worker; one hop for everything the dashboard shows.
+        return (
+            self.store.version,
+            self.store.count_students(),
+            self.store.count_teachers(),
+            self.store.payment_stats("student", year, month),
+            self.store.payment_stats("teacher", year, month),
+        )
+
+    async def _refresh_dashboard(self) -> None:
         try:
-            year = _safe_int(self.dash_year.get(), self.settings.default_year)
-            month = self._month_index(self.dash_month.get())
+            year_text, month_text = self.dash_year.get(), self.dash_month.get()
+            year = _safe_int(year_text, self.settings.default_year)
+            month = self._month_index(month_text)
 
-            students = self.store.list_students()
-            teachers = self.store.list_teachers()
-            self.dash_students.configure(text=f"Students: {len(students)}")
-            self.dash_teachers.configure(text=f"Teachers: {len(teachers)}")
+            version, n_students, n_teachers, s, t = await self._io(self._dashboard_snapshot, year, month)
+            self.dash_students.configure(text=f"Students: {n_students}")
+            self.dash_teachers.configure(text=f"Teachers: {n_teachers}")
 
-            s = self.store.payment_stats("student", year, month)
-            t = self.store.payment_stats("teacher", year, month)
             self.dash_students_paid.configure(
                 text=f"Tuition (Paid/Pending): {s['paid']} / {s['pending']}  ({MONTHS[month-1]} {year})"
             )
             self.dash_teachers_paid.configure(
                 text=f"Salary (Paid/Pending): {t['paid']} / {t['pending']}  ({MONTHS[month-1]} {year})"
             )
+            self._freshness["dashboard"] = (version, year_text, month_text)
         except Exception as e:
             self.err_logger.log_exception(e, "refresh_dashboard")
 
     # ---------------- Settings ----------------
-    def _clear_scrollable(self, frame: ctk.CTkScrollableFrame) -> None:
-        for child in frame.winfo_children():
-            child.destroy()
-
     def refresh_custom_fields_views(self) -> None:
-        self._clear_scrollable(self.student_cf_list)
-        for cf in self.settings.student_custom_fields:
-            row = ctk.CTkFrame(self.student_cf_list)
-            row.grid(sticky="ew", padx=6, pady=4)
-            row.grid_columnconfigure(0, weight=1)
-            ctk.CTkLabel(row, text=cf, anchor="w").grid(row=0, column=0, padx=8, pady=8, sticky="ew")
-            ctk.CTkButton(row, text="Remove", width=90, command=lambda _cf=cf: self.remove_student_custom_field(_cf)).grid(
-                row=0, column=1, padx=8, pady=8
-            )
-
-        self._clear_scrollable(self.teacher_cf_list)
-        for cf in self.settings.teacher_custom_fields:
-            row = ctk.CTkFrame(self.teacher_cf_list)
-            row.grid(sticky="ew", padx=6, pady=4)
-            row.grid_columnconfigure(0, weight=1)
-            ctk.CTkLabel(row, text=cf, anchor="w").grid(row=0, column=0, padx=8, pady=8, sticky="ew")
-            ctk.CTkButton(row, text="Remove", width=90, command=lambda _cf=cf: self.remove_teacher_custom_field(_cf)).grid(
-                row=0, column=1, padx=8, pady=8
-            )
+        if "settings" not in self._pages:
+            return
+        for tree, fields in (
+            (self.student_cf_list, self.settings.student_custom_fields),
+            (self.teacher_cf_list, self.settings.teacher_custom_fields),
+        ):
+            tree.delete(*tree.get_children(""))
+            _bulk_insert(tree, "end", [(cf, "", cf, "Remove") for cf in fields])
+        self._freshness["settings"] = self._page_stamp("settings")
 
     def add_student_custom_field(self) -> None:
         raw = self.student_cf_entry.get()
@@ -1203,7 +1835,7 @@ class HTSMSApp(ctk.CTk):
             return
         if name in self.settings.student_custom_fields:
             return
-        self.settings.student_custom_fields.append(name)
+        self.settings = replace(self.settings, student_custom_fields=(*self.settings.student_custom_fields, name))
         self.student_cf_entry.delete(0, "end")
         self.save_settings(rebuild_workbook=True)
 
@@ -1214,35 +1846,56 @@ class HTSMSApp(ctk.CTk):
             return
         if name in self.settings.teacher_custom_fields:
             return
-        self.settings.teacher_custom_fields.append(name)
+        self.settings = replace(self.settings, teacher_custom_fields=(*self.settings.teacher_custom_fields, name))
         self.teacher_cf_entry.delete(0, "end")
         self.save_settings(rebuild_workbook=True)
 
     def remove_student_custom_field(self, name: str) -> None:
         if name in self.settings.student_custom_fields:
-            self.settings.student_custom_fields.remove(name)
+            fields = list(self.settings.student_custom_fields)
+            fields.remove(name)
+            self.settings = replace(self.settings, student_custom_fields=tuple(fields))
             self.save_settings(rebuild_workbook=True)
 
     def remove_teacher_custom_field(self, name: str) -> None:
         if name in self.settings.teacher_custom_fields:
-            self.settings.teacher_custom_fields.remove(name)
+            fields = list(self.settings.teacher_custom_fields)
+            fields.remove(name)
+            self.settings = replace(self.settings, teacher_custom_fields=tuple(fields))
             self.save_settings(rebuild_workbook=True)
 
     def save_settings(self, rebuild_workbook: bool = False) -> None:
         try:
-            self.settings.student_id_prefix = (self.student_prefix.get() or "STU-").strip() or "STU-"
-            self.settings.teacher_id_prefix = (self.teacher_prefix.get() or "TCH-").strip() or "TCH-"
-            self.settings.appearance_mode = (self.appearance_mode.get() or "System").strip().capitalize()
             try:
-                self.settings.ui_scaling = float(self.ui_scale.get() or 1.0)
+                ui_scaling = float(self.ui_scale.get() or 1.0)
             except Exception:
-                self.settings.ui_scaling = 1.0
+                ui_scaling = 1.0
+            st = self.settings = replace(
+                self.settings,
+                student_id_prefix=(self.student_prefix.get() or "STU-").strip() or "STU-",
+                teacher_id_prefix=(self.teacher_prefix.get() or "TCH-").strip() or "TCH-",
+                appearance_mode=(self.appearance_mode.get() or "System").strip().capitalize(),
+                ui_scaling=ui_scaling,
+            )
 
-            self.settings_store.save(self.settings)
-            if rebuild_workbook:
-                self.store.ensure_workbook(self.settings.student_custom_fields, self.settings.teacher_custom_fields)
+            old = self._settings_snapshot
+            if st == old:
+                return
+            self.settings_store.save(st)
+            self._settings_snapshot = st
+            if rebuild_workbook and (
+                st.student_custom_fields != old.student_custom_fields
+                or st.teacher_custom_fields != old.teacher_custom_fields
+            ):
+                self._submit(
+                    "ensure_workbook",
+                    self.store.ensure_workbook,
+                    list(self.settings.student_custom_fields),
+                    list(self.settings.teacher_custom_fields),
+                )
 
             self._apply_ui_settings()
+            self._sync_custom_columns()
             self._emit("save_settings", "settings", "local", "updated settings.json")
             self.refresh_custom_fields_views()
             self.refresh_activity()
@@ -1251,7 +1904,20 @@ class HTSMSApp(ctk.CTk):
 
     # ---------------- Close ----------------
     def _on_close(self) -> None:
-        # Nothing special for now, but this is a good place for future cleanup.
+        self.after_cancel(self._pump_id)
+        # Let queued workbook writes land, then persist anything still deferred.
+        self._io_pool.shutdown(wait=True)
+        try:
+            self.store.flush()
+        except Exception as e:
+            self.err_logger.log_exception(e, "flush on close")
+        pending = asyncio.all_tasks(self._loop)
+        for task in pending:
+            task.cancel()
+        if pending:
+            self._loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        self._loop.close()
+        self.err_logger.close()
         self.destroy()
 
 
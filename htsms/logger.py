@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import threading
+import time
 import traceback
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
+from typing import TextIO
 
 from .constants import ERROR_LOG_PATH
 
@@ -20,15 +23,40 @@ class AppEvent:
 class ErrorLogger:
     def __init__(self, path: Path = ERROR_LOG_PATH):
         self.path = path
+        # Opened on first use and kept open; log_exception can be called from worker threads.
+        self._fh: TextIO | None = None
+        self._lock = threading.Lock()
+
+    def _handle(self) -> TextIO:
+        if self._fh is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._fh = self.path.open("a", encoding="utf-8")
+        return self._fh
 
     def log_exception(self, exc: BaseException, context: str = "") -> None:
-        self.path.parent.mkdir(parents=True, exist_ok=True)
         ts = datetime.now().isoformat(timespec="seconds")
-        with self.path.open("a", encoding="utf-8") as f:
-            f.write(f"[{ts}] {context}\n")
-            f.write("".join(traceback.format_exception(type(exc), exc, exc.__traceback__)))
-            f.write("\n")
+        text = "".join([f"[{ts}] {context}\n", *traceback.format_exception(type(exc), exc, exc.__traceback__), "\n"])
+        with self._lock:
+            f = self._handle()
+            f.write(text)
+            # One write + flush per entry so nothing is lost if the app dies right after.
+            f.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+
+
+# (epoch second, formatted) for the last call; one tuple so threads never see a torn pair.
+_ts_cache: tuple[int, str] = (-1, "")
 
 
 def now_ts() -> str:
-    return datetime.now().isoformat(timespec="seconds")
+    global _ts_cache
+    sec = int(time.time())
+    cached = _ts_cache
+    if cached[0] != sec:
+        cached = _ts_cache = (sec, time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(sec)))
+    return cached[1]
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import heapq
 import os
+import queue
+import re
+import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
-from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Sequence
 
 from PySide6 import QtCore, QtGui, QtWidgets
 from PySide6.QtCharts import QBarCategoryAxis, QBarSeries, QBarSet, QChart, QChartView, QPieSeries, QValueAxis
@@ -20,6 +25,9 @@ MONTHS = [
     "July", "August", "September", "October", "November", "December"
 ]
 
+# Error text that points at a locked/read-only workbook (see MainWindow._show_error).
+_PERM_RE = re.compile(r"permission|denied", re.I)
+
 
 def _app_dark_palette() -> QtGui.QPalette:
     p = QtGui.QPalette()
@@ -39,9 +47,8 @@ def _app_dark_palette() -> QtGui.QPalette:
     return p
 
 
-def _qss() -> str:
-    # Keep it crisp: no blur effects; only clean borders, spacing and contrast.
-    return """
+# Keep it crisp: no blur effects; only clean borders, spacing and contrast.
+_QSS = """
     QWidget { font-size: 12px; }
 
     QFrame#Sidebar { background: #0b0d11; border-right: 1px solid #222733; }
@@ -119,6 +126,22 @@ def _qss() -> str:
     """
 
 
+def _qss() -> str:
+    return _QSS
+
+
+def _id_sort_key(person_id: str) -> tuple[str, int, str]:
+    """Order ids like ``STU-9`` before ``STU-10``: text prefix, then the numeric tail."""
+    s = person_id.strip().casefold()
+    head = s.rstrip("0123456789")
+    tail = s[len(head) :]
+    return (head, int(tail) if tail else -1, s)
+
+
+# Roles the table models answer; anything else returns None before any other work.
+_DATA_ROLES = frozenset({QtCore.Qt.DisplayRole, QtCore.Qt.EditRole, QtCore.Qt.UserRole})
+
+
 @dataclass
 class Selected:
     entity: str = ""
@@ -126,19 +149,212 @@ class Selected:
 
 
 class StudentTableModel(QtCore.QAbstractTableModel):
+    """Students table that filters and sorts itself.
+
+    View rows map to source rows through ``_visible``, so a new search is one
+    Python pass over cached lowercase text instead of a filterAcceptsRow
+    callback per row from QSortFilterProxyModel.
+    """
+
     COLUMNS = ["ID", "Name", "Age", "Class", "Section", "Primary", "Secondary"]
+    ALL_CLASSES = "(All classes)"
+    ALL_SECTIONS = "(All sections)"
+    SEARCH_FIELDS = ("All", "Name", "ID", "Age", "Class", "Section", "Contact")
 
     def __init__(self, rows: list[dict[str, Any]] | None = None):
         super().__init__()
         self._rows: list[dict[str, Any]] = rows or []
+        # Lowercased search text as one column per Students page "field" combo entry,
+        # parallel to _rows, so a search scans a single flat list of strings.
+        self._search: dict[str, list[str]] = self._search_columns(self._rows)
+        # Cell strings per row, built once so paint-time data() is a tuple index.
+        self._cells: list[tuple[str, ...]] = [self._display(r) for r in self._rows]
+        self._ids: list[str] = [c[0].strip() for c in self._cells]
+        # student_id -> source row, for O(1) lookups by id.
+        self._by_id: dict[str, int] = {sid: i for i, sid in enumerate(self._ids)}
+        # Per-row, per-column sort keys so sort() is one list.sort over ready-made values.
+        self._keys: list[tuple[Any, ...]] = [self._sort_key(c) for c in self._cells]
+        self._visible: list[int] = list(range(len(self._rows)))
+        # Source row -> view row for the visible rows; rebuilt with _visible, see row_of.
+        self._view_pos: dict[int, int] = {i: i for i in self._visible}
+        # Rows come in sheet order; show them by ID until a header is clicked.
+        self._sort: tuple[int, QtCore.Qt.SortOrder] | None = (0, QtCore.Qt.AscendingOrder)
+
+        self.search_text = ""
+        self.field = "All"
+        self.class_filter = self.ALL_CLASSES
+        self.section_filter = self.ALL_SECTIONS
+        # Source rows accepted by the last pass. Typing more characters can only
+        # narrow a substring match, so the next pass only needs to re-check these.
+        self._accepted: list[int] | None = None
+        # No search text and no class/section filter: every row is visible.
+        self._pass_all = True
 
     def set_rows(self, rows: list[dict[str, Any]]) -> None:
-        self.beginResetModel()
-        self._rows = rows
-        self.endResetModel()
+        """Replace the rows without resetting the view.
+
+        When the same students come back in the same order (an edit, or a file
+        tick with no roster change) and the same rows stay visible, only the rows
+        whose cells changed are repainted. Otherwise the visible rows are swapped
+        in one layout change that keeps the selection on the same student ids.
+        """
+        search = self._search_columns(rows)
+        cells = [self._display(r) for r in rows]
+        ids = [c[0].strip() for c in cells]
+        keys = [self._sort_key(c) for c in cells]
+        visible = self._sorted(self._filtered(range(len(rows)), search), keys)
+
+        def swap() -> None:
+            self._rows = rows
+            self._search = search
+            self._cells = cells
+            self._ids = ids
+            self._by_id = {sid: i for i, sid in enumerate(ids)}
+            self._keys = keys
+
+        if ids == self._ids and visible == self._visible:
+            old_cells = self._cells
+            swap()
+            last = len(self.COLUMNS) - 1
+            for n, i in enumerate(visible):
+                if cells[i] != old_cells[i]:
+                    self.dataChanged.emit(self.index(n, 0), self.index(n, last))
+            return
+        self._relayout(visible, swap)
+
+    @classmethod
+    def _search_columns(cls, rows: list[dict[str, Any]]) -> dict[str, list[str]]:
+        cols: dict[str, list[str]] = {f: [] for f in (*cls.SEARCH_FIELDS, "class_norm", "section_norm")}
+        c_all, c_name, c_id, c_age = cols["All"], cols["Name"], cols["ID"], cols["Age"]
+        c_cls, c_sec, c_contact = cols["Class"], cols["Section"], cols["Contact"]
+        # Stripped class/section as the combos show them, for exact-match filtering.
+        c_cls_norm, c_sec_norm = cols["class_norm"], cols["section_norm"]
+        for row in rows:
+            sid = str(row.get("student_id", "") or "").lower()
+            name = f"{row.get('first_name','') or ''} {row.get('last_name','') or ''}".strip().lower()
+            age = str(row.get("age", "") or "").lower()
+            cl_raw = str(row.get("class", "") or "")
+            sec_raw = str(row.get("section", "") or "")
+            cl = sys.intern(cl_raw.lower())
+            sec = sys.intern(sec_raw.lower())
+            p1 = str(row.get("primary_contact", "") or "").lower()
+            p2 = str(row.get("secondary_contact", "") or "").lower()
+            c_all.append(" ".join([sid, name, age, cl, sec, p1, p2]))
+            c_name.append(name)
+            c_id.append(sid)
+            c_age.append(age)
+            c_cls.append(cl)
+            c_sec.append(sec)
+            c_contact.append(f"{p1} {p2}")
+            c_cls_norm.append(sys.intern(cl_raw.strip()))
+            c_sec_norm.append(sys.intern(sec_raw.strip()))
+        return cols
+
+    # ---- filtering / sorting ----
+    def apply_filters(self, *, search: str, field: str, cls: str, sec: str) -> None:
+        search = (search or "").strip().lower()
+        field = field or "All"
+        cls = cls or self.ALL_CLASSES
+        sec = sec or self.ALL_SECTIONS
+        narrowing = (
+            self._accepted is not None
+            and (field, cls, sec) == (self.field, self.class_filter, self.section_filter)
+            and search.startswith(self.search_text)
+        )
+        self.search_text = search
+        self.field = field
+        self.class_filter = cls
+        self.section_filter = sec
+        was_all = self._pass_all
+        self._pass_all = not search and cls == self.ALL_CLASSES and sec == self.ALL_SECTIONS
+        if self._pass_all and was_all:
+            # Still unfiltered (e.g. only the search field changed): nothing to redo.
+            return
+
+        candidates = self._accepted if narrowing else range(len(self._rows))
+        self._relayout(self._sorted(self._filtered(candidates, self._search), self._keys))
 
+    def _filtered(self, candidates, search: dict[str, list[str]]) -> list[int]:
+        # One comprehension per active filter: each is a single tight loop over
+        # the surviving indexes rather than a per-row chain of Python checks.
+        cls = self.class_filter
+        sec = self.section_filter
+        q = self.search_text
+        out = list(candidates)
+        if self._pass_all:
+            self._accepted = out
+            return list(out)
+        if cls != self.ALL_CLASSES:
+            col = search["class_norm"]
+            out = [i for i in out if col[i] == cls]
+        if sec != self.ALL_SECTIONS:
+            col = search["section_norm"]
+            out = [i for i in out if col[i] == sec]
+        if q:
+            # Unknown fields search everything.
+            col = search[self.field] if self.field in self.SEARCH_FIELDS else search["All"]
+            out = [i for i in out if q in col[i]]
+        self._accepted = out
+        return list(out)
+
+    def sort(self, column: int, order: QtCore.Qt.SortOrder = QtCore.Qt.AscendingOrder) -> None:
+        self._sort = (column, order)
+        self._relayout(self._sorted(list(self._visible), self._keys))
+
+    @staticmethod
+    def _sort_key(cells: tuple[str, ...]) -> tuple[Any, ...]:
+        # Text columns sort case-insensitively, IDs by their numeric tail; Age sorts
+        # numerically, with blanks and non-numbers after the numbers.
+        keys: list[Any] = [c.casefold() for c in cells]
+        keys[0] = _id_sort_key(cells[0])
+        age = cells[2].strip()
+        try:
+            keys[2] = (0, float(age), "")
+        except ValueError:
+            keys[2] = (1, 0.0, keys[2])
+        return tuple(keys)
+
+    def _sorted(self, visible: list[int], keys: list[tuple[Any, ...]]) -> list[int]:
+        if self._sort is None:
+            return visible
+        column, order = self._sort
+        if not 0 <= column < len(self.COLUMNS):
+            return visible
+        col = [k[column] for k in keys]
+        visible.sort(key=col.__getitem__, reverse=order == QtCore.Qt.DescendingOrder)
+        return visible
+
+    def _all_visible(self) -> list[int]:
+        return self._sorted(self._filtered(range(len(self._rows)), self._search), self._keys)
+
+    def _relayout(self, visible: list[int] | None, swap: Callable[[], None] | None = None) -> None:
+        # Swap the visible rows (and, via ``swap``, the row data) while keeping
+        # persistent indexes (selection, current row) pointed at the same students.
+        # ``visible=None`` re-filters after the swap.
+        self.layoutAboutToBeChanged.emit()
+        old = self.persistentIndexList()
+        # If the swap or re-filter fails, drop the persistent indexes rather than
+        # leave the view stuck between layoutAboutToBeChanged and layoutChanged.
+        new = [QtCore.QModelIndex()] * len(old)
+        try:
+            ids = self._ids
+            old_ids = [ids[self._visible[ix.row()]] if 0 <= ix.row() < len(self._visible) else None for ix in old]
+            if swap is not None:
+                swap()
+            self._visible = self._all_visible() if visible is None else visible
+            self._view_pos = {src: n for n, src in enumerate(self._visible)}
+            new = [self._persistent_for(sid, ix.column()) for ix, sid in zip(old, old_ids)]
+        finally:
+            self.changePersistentIndexList(old, new)
+            self.layoutChanged.emit()
+
+    def _persistent_for(self, student_id: str | None, column: int) -> QtCore.QModelIndex:
+        row = None if student_id is None else self.row_of(student_id)
+        return QtCore.QModelIndex() if row is None else self.index(row, column)
+
+    # ---- Qt model API ----
     def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:  # noqa: N802
-        return 0 if parent.isValid() else len(self._rows)
+        return 0 if parent.isValid() else len(self._visible)
 
     def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:  # noqa: N802
         return 0 if parent.isValid() else len(self.COLUMNS)
@@ -151,90 +367,119 @@ class StudentTableModel(QtCore.QAbstractTableModel):
                 return self.COLUMNS[section]
         return None
 
+    @staticmethod
+    def _display(r: dict[str, Any]) -> tuple[str, ...]:
+        sid = str(r.get("student_id", "") or "")
+        name = f"{r.get('first_name','') or ''} {r.get('last_name','') or ''}".strip()
+        age = r.get("age", "")
+        # A handful of class/section values repeat across the roster: share one str each.
+        cls = sys.intern(str(r.get("class", "") or ""))
+        sec = sys.intern(str(r.get("section", "") or ""))
+        p1 = str(r.get("primary_contact", "") or "")
+        p2 = str(r.get("secondary_contact", "") or "")
+        return (sid, name, "" if age is None else str(age), cls, sec, p1, p2)
+
     def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.DisplayRole):  # noqa: N802
-        if not index.isValid() or not (0 <= index.row() < len(self._rows)):
+        # Views ask for every role on each paint; only text and the row dict are served.
+        if role not in _DATA_ROLES or not index.isValid() or not (0 <= index.row() < len(self._visible)):
             return None
-        r = self._rows[index.row()]
+        i = self._visible[index.row()]
         col = index.column()
 
-        if role in (QtCore.Qt.DisplayRole, QtCore.Qt.EditRole):
-            sid = str(r.get("student_id", "") or "")
-            name = f"{r.get('first_name','') or ''} {r.get('last_name','') or ''}".strip()
-            age = r.get("age", "")
-            cls = str(r.get("class", "") or "")
-            sec = str(r.get("section", "") or "")
-            p1 = str(r.get("primary_contact", "") or "")
-            p2 = str(r.get("secondary_contact", "") or "")
-            vals = [sid, name, "" if age is None else str(age), cls, sec, p1, p2]
+        if role != QtCore.Qt.UserRole:
+            vals = self._cells[i]
             if 0 <= col < len(vals):
                 return vals[col]
-        if role == QtCore.Qt.UserRole:
-            return r
-        return None
+            return None
+        return self._rows[i]
 
     def row_dict(self, row: int) -> dict[str, Any] | None:
-        if 0 <= row < len(self._rows):
-            return self._rows[row]
+        if 0 <= row < len(self._visible):
+            return self._rows[self._visible[row]]
         return None
 
+    def distinct(self, column: str) -> list[str]:
+        """Sorted non-empty values of a ``class_norm``/``section_norm`` column, for the filter combos."""
+        return sorted(set(self._search[column]) - {""})
+
+    def upsert_row(self, row: dict[str, Any]) -> None:
+        """Add or replace one student without rebuilding every other row."""
+        search = self._search_columns([row])
+        cells = self._display(row)
+        key = self._sort_key(cells)
+        sid = cells[0].strip()
+        i = self._by_id.get(sid)
+
+        if i is None:
+            def swap() -> None:
+                self._rows.append(row)
+                for name, col in self._search.items():
+                    col.append(search[name][0])
+                self._cells.append(cells)
+                self._ids.append(sid)
+                self._keys.append(key)
+                self._by_id[sid] = len(self._rows) - 1
+
+            self._relayout(None, swap)
+            return
 
-class StudentFilterProxyModel(QtCore.QSortFilterProxyModel):
-    def __init__(self):
-        super().__init__()
-        self.search_text = ""
-        self.field = "All"
-        self.class_filter = "(All classes)"
-        self.section_filter = "(All sections)"
-
-    def set_filters(self, *, search: str, field: str, cls: str, sec: str) -> None:
-        self.search_text = (search or "").strip().lower()
-        self.field = field or "All"
-        self.class_filter = cls or "(All classes)"
-        self.section_filter = sec or "(All sections)"
-        self.invalidateFilter()
+        # Same source index, so existing persistent indexes stay valid.
+        self._rows[i] = row
+        for name, col in self._search.items():
+            col[i] = search[name][0]
+        self._cells[i] = cells
+        self._keys[i] = key
+        visible = self._all_visible()
+        if visible != self._visible:
+            self._relayout(visible)
+            return
+        pos = self.row_of(sid)
+        if pos is not None:
+            self.dataChanged.emit(self.index(pos, 0), self.index(pos, len(self.COLUMNS) - 1))
 
-    def filterAcceptsRow(self, source_row: int, source_parent: QtCore.QModelIndex) -> bool:  # noqa: N802
-        model = self.sourceModel()
-        if model is None:
-            return True
-        idx = model.index(source_row, 0, source_parent)
-        row = model.data(idx, QtCore.Qt.UserRole)
-        if not isinstance(row, dict):
-            return True
-
-        if self.class_filter != "(All classes)":
-            if str(row.get("class", "") or "").strip() != self.class_filter:
-                return False
-        if self.section_filter != "(All sections)":
-            if str(row.get("section", "") or "").strip() != self.section_filter:
-                return False
+    def remove_row(self, student_id: str) -> None:
+        i = self._by_id.get(student_id)
+        if i is None:
+            return
 
-        q = self.search_text
-        if not q:
-            return True
+        def swap() -> None:
+            del self._rows[i]
+            for col in self._search.values():
+                del col[i]
+            del self._cells[i]
+            del self._ids[i]
+            del self._keys[i]
+            self._by_id = {sid: n for n, sid in enumerate(self._ids)}
 
-        name = f"{row.get('first_name','') or ''} {row.get('last_name','') or ''}".strip()
-        blob_map = {
-            "All": " ".join(
-                [
-                    str(row.get("student_id", "") or ""),
-                    name,
-                    str(row.get("age", "") or ""),
-                    str(row.get("class", "") or ""),
-                    str(row.get("section", "") or ""),
-                    str(row.get("primary_contact", "") or ""),
-                    str(row.get("secondary_contact", "") or ""),
-                ]
-            ),
-            "Name": name,
-            "ID": str(row.get("student_id", "") or ""),
-            "Age": str(row.get("age", "") or ""),
-            "Class": str(row.get("class", "") or ""),
-            "Section": str(row.get("section", "") or ""),
-            "Contact": f"{row.get('primary_contact','') or ''} {row.get('secondary_contact','') or ''}",
-        }
-        blob = str(blob_map.get(self.field, blob_map["All"]))
-        return q in blob.lower()
+        self._relayout(None, swap)
+
+    def get(self, student_id: str) -> dict[str, Any] | None:
+        i = self._by_id.get(student_id)
+        return None if i is None else self._rows[i]
+
+    def row_of(self, student_id: str) -> int | None:
+        """View row showing ``student_id``, or None if it is filtered out."""
+        i = self._by_id.get(student_id)
+        return None if i is None else self._view_pos.get(i)
+
+
+def _form_line_edits(
+    form: QtWidgets.QFormLayout, initial: dict[str, Any], fields: list[tuple[str, str]]
+) -> dict[str, QtWidgets.QLineEdit]:
+    """Add one prefilled QLineEdit row per (label, key) and return them by key."""
+    inputs: dict[str, QtWidgets.QLineEdit] = {}
+    for label, key in fields:
+        le = QtWidgets.QLineEdit(str(initial.get(key, "") or ""))
+        inputs[key] = le
+        form.addRow(label, le)
+    return inputs
+
+
+def _new_form() -> QtWidgets.QFormLayout:
+    form = QtWidgets.QFormLayout()
+    # Set before rows are added so the layout isn't re-resolved per row.
+    form.setFieldGrowthPolicy(QtWidgets.QFormLayout.AllNonFixedFieldsGrow)
+    return form
 
 
 class StudentDialog(QtWidgets.QDialog):
@@ -245,7 +490,7 @@ class StudentDialog(QtWidgets.QDialog):
         title: str,
         student_id: str,
         initial: dict[str, Any] | None,
-        custom_fields: list[str],
+        custom_fields: Sequence[str],
     ):
         super().__init__(parent)
         self.setWindowTitle(title)
@@ -264,9 +509,8 @@ class StudentDialog(QtWidgets.QDialog):
 
         root.addWidget(QtWidgets.QLabel(f"Student ID: {student_id}"))
 
-        form = QtWidgets.QFormLayout()
-        self.first = QtWidgets.QLineEdit(str(self.initial.get("first_name", "") or ""))
-        self.last = QtWidgets.QLineEdit(str(self.initial.get("last_name", "") or ""))
+        form = _new_form()
+        self._inputs = _form_line_edits(form, self.initial, [("First name *", "first_name"), ("Last name", "last_name")])
 
         self.age = QtWidgets.QSpinBox()
         self.age.setRange(0, 120)
@@ -274,19 +518,21 @@ class StudentDialog(QtWidgets.QDialog):
             self.age.setValue(int(str(self.initial.get("age", "") or "0").strip() or 0))
         except Exception:
             self.age.setValue(0)
-
-        self.cls = QtWidgets.QLineEdit(str(self.initial.get("class", "") or ""))
-        self.sec = QtWidgets.QLineEdit(str(self.initial.get("section", "") or ""))
-        self.p1 = QtWidgets.QLineEdit(str(self.initial.get("primary_contact", "") or ""))
-        self.p2 = QtWidgets.QLineEdit(str(self.initial.get("secondary_contact", "") or ""))
-
-        form.addRow("First name *", self.first)
-        form.addRow("Last name", self.last)
         form.addRow("Age (0 = unknown)", self.age)
-        form.addRow("Class", self.cls)
-        form.addRow("Section", self.sec)
-        form.addRow("Primary contact", self.p1)
-        form.addRow("Secondary contact", self.p2)
+
+        self._inputs.update(
+            _form_line_edits(
+                form,
+                self.initial,
+                [
+                    ("Class", "class"),
+                    ("Section", "section"),
+                    ("Primary contact", "primary_contact"),
+                    ("Secondary contact", "secondary_contact"),
+                ],
+            )
+        )
+        self.first = self._inputs["first_name"]
 
         self._custom: dict[str, QtWidgets.QLineEdit] = {}
         if self.custom_fields:
@@ -294,10 +540,7 @@ class StudentDialog(QtWidgets.QDialog):
             sep.setObjectName("SectionTitle")
             root.addSpacing(6)
             root.addWidget(sep)
-            for f in self.custom_fields:
-                w = QtWidgets.QLineEdit(str(self.initial.get(f, "") or ""))
-                self._custom[f] = w
-                form.addRow(f, w)
+            self._custom = _form_line_edits(form, self.initial, [(f, f) for f in self.custom_fields])
 
         root.addLayout(form)
 
@@ -315,16 +558,9 @@ class StudentDialog(QtWidgets.QDialog):
 
     def get_data(self) -> dict[str, Any]:
         age = int(self.age.value())
-        d: dict[str, Any] = {
-            "student_id": self.student_id,
-            "first_name": self.first.text().strip(),
-            "last_name": self.last.text().strip(),
-            "age": "" if age <= 0 else age,
-            "class": self.cls.text().strip(),
-            "section": self.sec.text().strip(),
-            "primary_contact": self.p1.text().strip(),
-            "secondary_contact": self.p2.text().strip(),
-        }
+        d: dict[str, Any] = {"student_id": self.student_id, "age": "" if age <= 0 else age}
+        for k, w in self._inputs.items():
+            d[k] = w.text().strip()
         for k, w in self._custom.items():
             d[k] = w.text().strip()
         return d
@@ -333,13 +569,9 @@ class StudentDialog(QtWidgets.QDialog):
 class Card(QtWidgets.QFrame):
     def __init__(self, title: str, value: str = "0", *, accent: str | None = None):
         super().__init__()
-        self.setProperty("class", "Card")
         self.setObjectName("Card")
-        self.setFrameShape(QtWidgets.QFrame.NoFrame)
-        self.setStyleSheet("QFrame#Card { }")
-        self.setProperty("qssClass", "Card")
         self.setProperty("class", "Card")
-        self.setObjectName("Card")
+        self.setFrameShape(QtWidgets.QFrame.NoFrame)
 
         lay = QtWidgets.QVBoxLayout(self)
         lay.setContentsMargins(16, 16, 16, 16)
@@ -378,16 +610,6 @@ class DashboardPage(QtWidgets.QWidget):
         self.cards_row = QtWidgets.QHBoxLayout()
         self.cards_row.setSpacing(14)
 
-        self.card_students = QtWidgets.QFrame()
-        self.card_students.setObjectName("Card")
-        self.card_students.setProperty("class", "Card")
-        self.card_teachers = QtWidgets.QFrame()
-        self.card_teachers.setObjectName("Card")
-        self.card_teachers.setProperty("class", "Card")
-        self.card_paid = QtWidgets.QFrame()
-        self.card_paid.setObjectName("Card")
-        self.card_paid.setProperty("class", "Card")
-
         self._card_students = Card("Students", "0", accent="#ffb100")
         self._card_teachers = Card("Teachers", "0", accent="#60a5fa")
         self._card_paid = Card("Student payments (Paid)", "0", accent="#34d399")
@@ -426,40 +648,37 @@ class DashboardPage(QtWidgets.QWidget):
 
         root.addLayout(charts_row, 1)
 
+        # Last values drawn, so refreshes with unchanged counts leave the charts alone.
+        self._last_pay: tuple[int, int] | None = None
+        self._last_classes: tuple[tuple[str, int], ...] | None = None
+        self._build_charts()
+
     def set_counts(self, *, students: int, teachers: int, student_paid: int) -> None:
         self._card_students.set_value(str(students))
         self._card_teachers.set_value(str(teachers))
         self._card_paid.set_value(str(student_paid))
 
-    def set_payments_chart(self, *, paid: int, pending: int) -> None:
-        series = QPieSeries()
-        series.append("Paid", max(paid, 0))
-        series.append("Pending", max(pending, 0))
-        for sl in series.slices():
+    def _build_charts(self) -> None:
+        # Charts, series and axes are created once; refreshes only update values.
+        self._pie_series = QPieSeries()
+        for label, color in (("Paid", QtGui.QColor(52, 211, 153)), ("Pending", QtGui.QColor(96, 165, 250))):
+            sl = self._pie_series.append(label, 0)
             sl.setLabelVisible(True)
             sl.setLabelColor(QtGui.QColor(236, 240, 244))
-        # Accent colors
-        if series.count() >= 2:
-            series.slices()[0].setBrush(QtGui.QColor(52, 211, 153))
-            series.slices()[1].setBrush(QtGui.QColor(96, 165, 250))
+            sl.setBrush(color)
+        self._paid_slice, self._pending_slice = self._pie_series.slices()
 
         chart = QChart()
-        chart.addSeries(series)
+        chart.addSeries(self._pie_series)
         chart.setBackgroundVisible(False)
         chart.legend().setLabelColor(QtGui.QColor(236, 240, 244))
         chart.legend().setAlignment(QtCore.Qt.AlignBottom)
         self.chart_payments.setChart(chart)
 
-    def set_classes_chart(self, class_counts: dict[str, int]) -> None:
-        cats = list(class_counts.keys())
-        vals = [class_counts[k] for k in cats]
-
-        barset = QBarSet("Students")
-        barset.append(vals)
-        barset.setColor(QtGui.QColor(255, 177, 0))
-
+        self._bar_set = QBarSet("Students")
+        self._bar_set.setColor(QtGui.QColor(255, 177, 0))
         series = QBarSeries()
-        series.append(barset)
+        series.append(self._bar_set)
 
         chart = QChart()
         chart.addSeries(series)
@@ -467,21 +686,43 @@ class DashboardPage(QtWidgets.QWidget):
         chart.legend().setLabelColor(QtGui.QColor(236, 240, 244))
         chart.legend().setVisible(False)
 
-        axis_x = QBarCategoryAxis()
-        axis_x.append(cats or ["-"])
-        axis_x.setLabelsColor(QtGui.QColor(200, 206, 216))
-        chart.addAxis(axis_x, QtCore.Qt.AlignBottom)
-        series.attachAxis(axis_x)
+        self._bar_axis_x = QBarCategoryAxis()
+        self._bar_axis_x.append(["-"])
+        self._bar_axis_x.setLabelsColor(QtGui.QColor(200, 206, 216))
+        chart.addAxis(self._bar_axis_x, QtCore.Qt.AlignBottom)
+        series.attachAxis(self._bar_axis_x)
 
-        axis_y = QValueAxis()
-        axis_y.setLabelFormat("%d")
-        axis_y.setLabelsColor(QtGui.QColor(200, 206, 216))
-        axis_y.setGridLineColor(QtGui.QColor(31, 36, 49))
-        chart.addAxis(axis_y, QtCore.Qt.AlignLeft)
-        series.attachAxis(axis_y)
+        self._bar_axis_y = QValueAxis()
+        self._bar_axis_y.setLabelFormat("%d")
+        self._bar_axis_y.setLabelsColor(QtGui.QColor(200, 206, 216))
+        self._bar_axis_y.setGridLineColor(QtGui.QColor(31, 36, 49))
+        chart.addAxis(self._bar_axis_y, QtCore.Qt.AlignLeft)
+        series.attachAxis(self._bar_axis_y)
 
         self.chart_classes.setChart(chart)
 
+    def set_payments_chart(self, *, paid: int, pending: int) -> None:
+        key = (paid, pending)
+        if key == self._last_pay:
+            return
+        self._last_pay = key
+        self._paid_slice.setValue(max(paid, 0))
+        self._pending_slice.setValue(max(pending, 0))
+
+    def set_classes_chart(self, class_counts: dict[str, int]) -> None:
+        key = tuple(class_counts.items())
+        if key == self._last_classes:
+            return
+        self._last_classes = key
+        cats = list(class_counts.keys())
+        vals = [class_counts[k] for k in cats]
+
+        self._bar_set.remove(0, self._bar_set.count())
+        self._bar_set.append(vals)
+        self._bar_axis_x.clear()
+        self._bar_axis_x.append(cats or ["-"])
+        self._bar_axis_y.setRange(0, max(vals, default=0) or 1)
+
 
 class TeacherTableModel(QtCore.QAbstractTableModel):
     COLUMNS = ["ID", "Name", "Role", "Primary", "Secondary"]
@@ -489,11 +730,90 @@ class TeacherTableModel(QtCore.QAbstractTableModel):
     def __init__(self, rows: list[dict[str, Any]] | None = None):
         super().__init__()
         self._rows: list[dict[str, Any]] = rows or []
+        # Cell strings per row, built once so paint-time data() is a tuple index.
+        self._cells: list[tuple[str, ...]] = [self._display(r) for r in self._rows]
+        # teacher_id -> row, for O(1) lookups by id.
+        self._by_id: dict[str, int] = self._index(self._cells)
+        # Lowercased text of the shown cells per row, for TeacherFilterProxyModel.
+        self._blobs: list[str] = [self._search_blob(c) for c in self._cells]
+        # The model keeps its rows in display order; see sort().
+        self._sort: tuple[int, QtCore.Qt.SortOrder] = (0, QtCore.Qt.AscendingOrder)
+
+    @staticmethod
+    def _search_blob(cells: tuple[str, ...]) -> str:
+        return " ".join(cells).lower()
+
+    def search_blob(self, row: int) -> str:
+        return self._blobs[row]
+
+    @staticmethod
+    def _index(cells: list[tuple[str, ...]]) -> dict[str, int]:
+        return {c[0].strip(): i for i, c in enumerate(cells)}
 
     def set_rows(self, rows: list[dict[str, Any]]) -> None:
-        self.beginResetModel()
+        cells = [self._display(r) for r in rows]
+        perm = self._order(cells)
+        rows = [rows[i] for i in perm]
+        cells = [cells[i] for i in perm]
+        same_ids = len(cells) == len(self._cells) and all(
+            new[0] == old[0] for new, old in zip(cells, self._cells)
+        )
+        if not same_ids:
+            self.beginResetModel()
+        old_cells = self._cells
         self._rows = rows
-        self.endResetModel()
+        self._cells = cells
+        self._by_id = self._index(cells)
+        self._blobs = [self._search_blob(c) for c in cells]
+        if not same_ids:
+            self.endResetModel()
+            return
+        # Same teachers in the same order: repaint only the rows that changed.
+        last = len(self.COLUMNS) - 1
+        for n, (new, old) in enumerate(zip(cells, old_cells)):
+            if new != old:
+                self.dataChanged.emit(self.index(n, 0), self.index(n, last))
+
+    @staticmethod
+    def _display(r: dict[str, Any]) -> tuple[str, ...]:
+        tid = str(r.get("teacher_id", "") or "")
+        name = f"{r.get('first_name','') or ''} {r.get('last_name','') or ''}".strip()
+        role_val = sys.intern(str(r.get("role", "") or ""))
+        p1 = str(r.get("primary_contact", "") or "")
+        p2 = str(r.get("secondary_contact", "") or "")
+        return (tid, name, role_val, p1, p2)
+
+    def _order(self, cells: list[tuple[str, ...]]) -> list[int]:
+        column, order = self._sort
+        if not 0 <= column < len(self.COLUMNS):
+            return list(range(len(cells)))
+        if column == 0:
+            col = [_id_sort_key(c[0]) for c in cells]
+        else:
+            col = [c[column].casefold() for c in cells]
+        return sorted(range(len(cells)), key=col.__getitem__, reverse=order == QtCore.Qt.DescendingOrder)
+
+    def sort(self, column: int, order: QtCore.Qt.SortOrder = QtCore.Qt.AscendingOrder) -> None:
+        self._sort = (column, order)
+        self._resort()
+
+    def _resort(self) -> None:
+        perm = self._order(self._cells)
+        if perm == list(range(len(perm))):
+            return
+        self.layoutAboutToBeChanged.emit()
+        old = self.persistentIndexList()
+        old_ids = [self._cells[ix.row()][0] if 0 <= ix.row() < len(self._cells) else None for ix in old]
+        self._rows = [self._rows[i] for i in perm]
+        self._cells = [self._cells[i] for i in perm]
+        self._blobs = [self._blobs[i] for i in perm]
+        self._by_id = self._index(self._cells)
+        new = [
+            self.index(self._by_id[tid.strip()], ix.column()) if tid is not None else QtCore.QModelIndex()
+            for ix, tid in zip(old, old_ids)
+        ]
+        self.changePersistentIndexList(old, new)
+        self.layoutChanged.emit()
 
     def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
         return 0 if parent.isValid() else len(self._rows)
@@ -510,29 +830,90 @@ class TeacherTableModel(QtCore.QAbstractTableModel):
         return None
 
     def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.DisplayRole):
-        if not index.isValid() or not (0 <= index.row() < len(self._rows)):
+        if role not in _DATA_ROLES or not index.isValid() or not (0 <= index.row() < len(self._rows)):
             return None
-        r = self._rows[index.row()]
+        row = index.row()
         col = index.column()
 
-        if role in (QtCore.Qt.DisplayRole, QtCore.Qt.EditRole):
-            tid = str(r.get("teacher_id", "") or "")
-            name = f"{r.get('first_name','') or ''} {r.get('last_name','') or ''}".strip()
-            role_val = str(r.get("role", "") or "")
-            p1 = str(r.get("primary_contact", "") or "")
-            p2 = str(r.get("secondary_contact", "") or "")
-            vals = [tid, name, role_val, p1, p2]
+        if role != QtCore.Qt.UserRole:
+            vals = self._cells[row]
             if 0 <= col < len(vals):
                 return vals[col]
-        if role == QtCore.Qt.UserRole:
-            return r
-        return None
+            return None
+        return self._rows[row]
 
     def row_dict(self, row: int) -> dict[str, Any] | None:
         if 0 <= row < len(self._rows):
             return self._rows[row]
         return None
 
+    def get(self, teacher_id: str) -> dict[str, Any] | None:
+        i = self._by_id.get(teacher_id)
+        return None if i is None else self._rows[i]
+
+    def row_for_id(self, teacher_id: str) -> int | None:
+        return self._by_id.get(teacher_id)
+
+    def upsert_row(self, row: dict[str, Any]) -> None:
+        """Add or replace one teacher without resetting the model."""
+        cells = self._display(row)
+        tid = cells[0].strip()
+        i = self._by_id.get(tid)
+        if i is None:
+            n = len(self._rows)
+            self.beginInsertRows(QtCore.QModelIndex(), n, n)
+            self._rows.append(row)
+            self._cells.append(cells)
+            self._blobs.append(self._search_blob(cells))
+            self._by_id[tid] = n
+            self.endInsertRows()
+            self._resort()
+            return
+        self._rows[i] = row
+        if cells != self._cells[i]:
+            self._cells[i] = cells
+            self._blobs[i] = self._search_blob(cells)
+            self.dataChanged.emit(self.index(i, 0), self.index(i, len(self.COLUMNS) - 1))
+            self._resort()
+
+    def remove_row(self, teacher_id: str) -> None:
+        i = self._by_id.get(teacher_id)
+        if i is None:
+            return
+        self.beginRemoveRows(QtCore.QModelIndex(), i, i)
+        del self._rows[i]
+        del self._cells[i]
+        del self._blobs[i]
+        self._by_id = self._index(self._cells)
+        self.endRemoveRows()
+
+
+class TeacherFilterProxyModel(QtCore.QSortFilterProxyModel):
+    """Teachers search: one substring test per row against the model's cached blob.
+
+    The stock fixed-string filter asks the Python model's data() for every
+    column of every row on each keystroke.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._needle = ""
+
+    def set_search(self, text: str) -> None:
+        needle = text.strip().lower()
+        if needle == self._needle:
+            return
+        self._needle = needle
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QtCore.QModelIndex) -> bool:  # noqa: N802
+        return not self._needle or self._needle in self.sourceModel().search_blob(source_row)
+
+    def sort(self, column: int, order: QtCore.Qt.SortOrder = QtCore.Qt.AscendingOrder) -> None:
+        # The source model sorts itself on plain Python keys; the proxy only filters,
+        # so it never calls data() per comparison.
+        self.sourceModel().sort(column, order)
+
 
 class TeacherDialog(QtWidgets.QDialog):
     def __init__(
@@ -542,7 +923,7 @@ class TeacherDialog(QtWidgets.QDialog):
         title: str,
         teacher_id: str,
         initial: dict[str, Any] | None,
-        custom_fields: list[str],
+        custom_fields: Sequence[str],
     ):
         super().__init__(parent)
         self.setWindowTitle(title)
@@ -561,18 +942,19 @@ class TeacherDialog(QtWidgets.QDialog):
 
         root.addWidget(QtWidgets.QLabel(f"Teacher ID: {teacher_id}"))
 
-        form = QtWidgets.QFormLayout()
-        self.first = QtWidgets.QLineEdit(str(self.initial.get("first_name", "") or ""))
-        self.last = QtWidgets.QLineEdit(str(self.initial.get("last_name", "") or ""))
-        self.role = QtWidgets.QLineEdit(str(self.initial.get("role", "") or ""))
-        self.p1 = QtWidgets.QLineEdit(str(self.initial.get("primary_contact", "") or ""))
-        self.p2 = QtWidgets.QLineEdit(str(self.initial.get("secondary_contact", "") or ""))
-
-        form.addRow("First name *", self.first)
-        form.addRow("Last name", self.last)
-        form.addRow("Role/Subject", self.role)
-        form.addRow("Primary contact", self.p1)
-        form.addRow("Secondary contact", self.p2)
+        form = _new_form()
+        self._inputs = _form_line_edits(
+            form,
+            self.initial,
+            [
+                ("First name *", "first_name"),
+                ("Last name", "last_name"),
+                ("Role/Subject", "role"),
+                ("Primary contact", "primary_contact"),
+                ("Secondary contact", "secondary_contact"),
+            ],
+        )
+        self.first = self._inputs["first_name"]
 
         self._custom: dict[str, QtWidgets.QLineEdit] = {}
         if self.custom_fields:
@@ -580,10 +962,7 @@ class TeacherDialog(QtWidgets.QDialog):
             sep.setObjectName("SectionTitle")
             root.addSpacing(6)
             root.addWidget(sep)
-            for f in self.custom_fields:
-                w = QtWidgets.QLineEdit(str(self.initial.get(f, "") or ""))
-                self._custom[f] = w
-                form.addRow(f, w)
+            self._custom = _form_line_edits(form, self.initial, [(f, f) for f in self.custom_fields])
 
         root.addLayout(form)
 
@@ -600,19 +979,22 @@ class TeacherDialog(QtWidgets.QDialog):
         self.accept()
 
     def get_data(self) -> dict[str, Any]:
-        d: dict[str, Any] = {
-            "teacher_id": self.teacher_id,
-            "first_name": self.first.text().strip(),
-            "last_name": self.last.text().strip(),
-            "role": self.role.text().strip(),
-            "primary_contact": self.p1.text().strip(),
-            "secondary_contact": self.p2.text().strip(),
-        }
+        d: dict[str, Any] = {"teacher_id": self.teacher_id}
+        for k, w in self._inputs.items():
+            d[k] = w.text().strip()
         for k, w in self._custom.items():
             d[k] = w.text().strip()
         return d
 
 
+def _fix_row_height(table: QtWidgets.QTableView, height: int = 28) -> None:
+    # Every row the same fixed height: scrolling never asks the model for size hints.
+    vh = table.verticalHeader()
+    vh.setVisible(False)
+    vh.setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
+    vh.setDefaultSectionSize(height)
+
+
 class StudentsPage(QtWidgets.QWidget):
     def __init__(self, parent: QtWidgets.QWidget):
         super().__init__(parent)
@@ -658,7 +1040,8 @@ class StudentsPage(QtWidgets.QWidget):
         self.table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
         self.table.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
         self.table.horizontalHeader().setStretchLastSection(True)
-        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Interactive)
+        _fix_row_height(self.table)
 
         root.addWidget(self.table, 1)
 
@@ -699,12 +1082,47 @@ class TeachersPage(QtWidgets.QWidget):
         self.table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
         self.table.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
         self.table.horizontalHeader().setStretchLastSection(True)
-        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Interactive)
+        _fix_row_height(self.table)
 
         root.addWidget(self.table, 1)
 
 
+class ReloadWorker(QtCore.QObject):
+    """Re-reads the workbook after an external change, off the GUI thread.
+
+    Emits the fresh student and teacher rows with the store version they were
+    read at; the dashboard's payment stats are computed here too so the store's
+    caches are warm when the window refreshes.
+    """
+
+    finished = QtCore.Signal(list, list, int)
+    failed = QtCore.Signal(object)
+
+    def __init__(self, store: ExcelStore, year: int, month: int):
+        super().__init__()
+        self.store = store
+        self.year = year
+        self.month = month
+
+    @QtCore.Slot()
+    def run(self) -> None:
+        try:
+            self.store.invalidate_cache()
+            students = self.store.list_students()
+            teachers = self.store.list_teachers()
+            self.store.payment_stats("student", self.year, self.month)
+            version = self.store.version
+        except Exception as e:
+            self.failed.emit(e)
+            return
+        self.finished.emit(students, teachers, version)
+
+
 class MainWindow(QtWidgets.QMainWindow):
+    # Workbook signature after the event thread's save; delivered on the GUI thread.
+    events_saved = QtCore.Signal(object)
+
     def __init__(self):
         super().__init__()
         self.err_logger = ErrorLogger()
@@ -715,7 +1133,22 @@ class MainWindow(QtWidgets.QMainWindow):
         self.store.ensure_workbook(self.settings.student_custom_fields, self.settings.teacher_custom_fields)
 
         self.selected = Selected()
-        self._last_mtime: float = 0.0
+        # (mtime_ns, size) of the workbook as last loaded; see _tick.
+        self._file_sig: tuple[int, int] | None = self._data_file_sig()
+        # Activity events are written by one background thread so CRUD handlers don't
+        # wait on a workbook save; see _emit.
+        self._event_queue: queue.Queue[AppEvent] = queue.Queue()
+        self._event_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="htsms-events")
+        # Set by closeEvent once the pool is shut down; later events are written inline.
+        self._events_closed = False
+        self.events_saved.connect(self._on_events_saved)
+        # Items last put in each filter combo by _refill_combo.
+        self._combo_items: dict[QtWidgets.QComboBox, list[str]] = {}
+        # Last status-bar text; see _set_status.
+        self._last_status: str | None = None
+        # Background re-read after an external change; None when idle.
+        self._reload_thread: QtCore.QThread | None = None
+        self._reload_worker: ReloadWorker | None = None
 
         self.setWindowTitle(APP_NAME)
         self.resize(1360, 820)
@@ -726,12 +1159,31 @@ class MainWindow(QtWidgets.QMainWindow):
         # Initial load
         self.refresh_all(rebuild_filters=True)
 
-        # Poll file changes: this makes the table reflect external edits too.
+        # Reflect external edits: the watcher wakes us only when the workbook changes,
+        # and a slow poll re-arms it after editors that save by replacing the file.
+        self._file_changed = self._debounced(self._tick, 200)
+        self._fs_watch = QtCore.QFileSystemWatcher(self)
+        self._fs_watch.fileChanged.connect(lambda _p: self._file_changed.start())
+        self._watch_data_file()
         self._timer = QtCore.QTimer(self)
-        self._timer.setInterval(800)
+        self._timer.setInterval(10000)
         self._timer.timeout.connect(self._tick)
         self._timer.start()
 
+    def _debounced(self, slot, msec: int = 100) -> QtCore.QTimer:
+        """Single-shot timer that runs ``slot`` once typing pauses for ``msec``."""
+        timer = QtCore.QTimer(self)
+        timer.setSingleShot(True)
+        timer.setInterval(msec)
+        timer.timeout.connect(slot)
+        return timer
+
+    def _set_status(self, msg: str) -> None:
+        """Show ``msg`` in the status bar unless it is already showing."""
+        if msg != self._last_status:
+            self.statusBar().showMessage(msg)
+            self._last_status = msg
+
     # ---------- UI ----------
     def _build_ui(self) -> None:
         root = QtWidgets.QWidget()
@@ -754,6 +1206,8 @@ class MainWindow(QtWidgets.QMainWindow):
         sbl.addSpacing(6)
 
         self.nav_buttons: dict[str, QtWidgets.QPushButton] = {}
+        # Nav button currently styled active="true"; see show_page.
+        self._active_key: str | None = None
 
         def nav_btn(text: str, key: str) -> QtWidgets.QPushButton:
             b = QtWidgets.QPushButton(text)
@@ -812,38 +1266,38 @@ class MainWindow(QtWidgets.QMainWindow):
         self.page_dashboard = DashboardPage(self.pages)
         self.page_students = StudentsPage(self.pages)
         self.page_teachers = TeachersPage(self.pages)
-        self.page_payments = PaymentsPage(self.pages, self)
-        self.page_activity = ActivityPage(self.pages)
-        self.page_settings = SettingsPage(self.pages)
 
         self.pages.addWidget(self.page_dashboard)
         self.pages.addWidget(self.page_students)
         self.pages.addWidget(self.page_teachers)
-        self.pages.addWidget(self.page_payments)
-        self.pages.addWidget(self.page_activity)
-        self.pages.addWidget(self.page_settings)
+
+        # Payments, activity and settings are only read from their own handlers,
+        # so they are built the first time show_page visits them. Empty
+        # placeholders keep the stack indices stable until then.
+        self._lazy_pages: dict[str, tuple[str, Callable[[], QtWidgets.QWidget], Callable[[], None]]] = {
+            "payments": ("page_payments", lambda: PaymentsPage(self.pages, self), self._init_payments_page),
+            "activity": ("page_activity", lambda: ActivityPage(self.pages), self._init_activity_page),
+            "settings": ("page_settings", lambda: SettingsPage(self.pages), self._init_settings_page),
+        }
+        for _key in self._lazy_pages:
+            self.pages.addWidget(QtWidgets.QWidget())
 
         outer.addWidget(self.sidebar)
         outer.addWidget(self.content, 1)
 
         # Students data model
         self.students_model = StudentTableModel([])
-        self.students_proxy = StudentFilterProxyModel()
-        self.students_proxy.setSourceModel(self.students_model)
-        self.page_students.table.setModel(self.students_proxy)
+        self.page_students.table.setModel(self.students_model)
+        self.page_students.table.sortByColumn(0, QtCore.Qt.AscendingOrder)
 
         # Teachers data model
         self.teachers_model = TeacherTableModel([])
-        self.teachers_proxy = QtCore.QSortFilterProxyModel()
+        self.teachers_proxy = TeacherFilterProxyModel()
         self.teachers_proxy.setSourceModel(self.teachers_model)
         self.page_teachers.table.setModel(self.teachers_proxy)
+        self.page_teachers.table.sortByColumn(0, QtCore.Qt.AscendingOrder)
 
-        self.statusBar().showMessage("Ready")
-
-        # Apply card class styling by setting objectName for QSS
-        for w in self.findChildren(QtWidgets.QFrame):
-            if w.property("class") == "Card":
-                w.setProperty("class", "Card")
+        self._set_status("Ready")
 
     def _wire(self) -> None:
         self.btn_dash.clicked.connect(lambda: self.show_page("dashboard"))
@@ -854,10 +1308,12 @@ class MainWindow(QtWidgets.QMainWindow):
         self.btn_settings.clicked.connect(lambda: self.show_page("settings"))
 
         # Students interactions
-        self.page_students.search.textChanged.connect(self._apply_student_filters)
-        self.page_students.field.currentTextChanged.connect(self._apply_student_filters)
-        self.page_students.cls.currentTextChanged.connect(self._apply_student_filters)
-        self.page_students.sec.currentTextChanged.connect(self._apply_student_filters)
+        # Typing and combo changes restart a coalescing timer; the refilter runs once per pause.
+        self._student_filter_timer = self._debounced(self._apply_student_filters, 150)
+        self.page_students.search.textChanged.connect(lambda _t: self._student_filter_timer.start())
+        self.page_students.field.currentTextChanged.connect(lambda _t: self._student_filter_timer.start())
+        self.page_students.cls.currentTextChanged.connect(lambda _t: self._student_filter_timer.start())
+        self.page_students.sec.currentTextChanged.connect(lambda _t: self._student_filter_timer.start())
 
         self.page_students.btn_add.clicked.connect(self.add_student)
         self.page_students.btn_edit.clicked.connect(self.edit_student)
@@ -867,7 +1323,8 @@ class MainWindow(QtWidgets.QMainWindow):
         sel.selectionChanged.connect(self._on_student_selection_changed)
 
         # Teachers interactions
-        self.page_teachers.search.textChanged.connect(self._apply_teacher_filter)
+        self._teacher_search_timer = self._debounced(self._apply_teacher_filter)
+        self.page_teachers.search.textChanged.connect(lambda _t: self._teacher_search_timer.start())
         self.page_teachers.btn_add.clicked.connect(self.add_teacher)
         self.page_teachers.btn_edit.clicked.connect(self.edit_teacher)
         self.page_teachers.btn_del.clicked.connect(self.delete_teacher)
@@ -875,29 +1332,46 @@ class MainWindow(QtWidgets.QMainWindow):
         sel2 = self.page_teachers.table.selectionModel()
         sel2.selectionChanged.connect(self._on_teacher_selection_changed)
 
-        # Payments interactions
-        self.page_payments.entity_combo.currentTextChanged.connect(lambda: self.refresh_payments())
-        self.page_payments.month_combo.currentIndexChanged.connect(lambda: self.refresh_payments())
-        self.page_payments.year_spin.valueChanged.connect(lambda: self.refresh_payments())
-        self.page_payments.filter_combo.currentTextChanged.connect(lambda: self.refresh_payments())
+        # Payments / activity timers; their pages connect to them in _init_*_page.
+        # The payments status filter and the activity filters only touch each
+        # page's proxy, so they never re-read the workbook.
+        self._payments_timer = self._debounced(self.refresh_payments, 150)
+        self._activity_timer = self._debounced(self._apply_activity_filters, 150)
+
+    def _init_payments_page(self) -> None:
+        self.page_payments.entity_combo.currentTextChanged.connect(lambda: self._payments_timer.start())
+        self.page_payments.month_combo.currentIndexChanged.connect(lambda: self._payments_timer.start())
+        self.page_payments.year_spin.valueChanged.connect(lambda: self._payments_timer.start())
         self.page_payments.btn_set_payment.clicked.connect(self.set_payment)
 
-        # Activity interactions
-        self.page_activity.filter_action.currentTextChanged.connect(lambda: self.refresh_activity())
-        self.page_activity.search.textChanged.connect(lambda: self.refresh_activity())
+    def _init_activity_page(self) -> None:
+        self.page_activity.filter_action.currentTextChanged.connect(lambda: self._activity_timer.start())
+        self.page_activity.search.textChanged.connect(lambda: self._activity_timer.start())
 
-        # Settings interactions
+    def _init_settings_page(self) -> None:
         self.page_settings.btn_save.clicked.connect(self.save_settings)
 
+    def _ensure_page(self, key: str, idx: int) -> None:
+        """Build a lazily created page on its first visit, replacing its placeholder."""
+        spec = self._lazy_pages.pop(key, None)
+        if spec is None:
+            return
+        attr, factory, init = spec
+        page = factory()
+        setattr(self, attr, page)
+        init()
+        placeholder = self.pages.widget(idx)
+        self.pages.insertWidget(idx, page)
+        self.pages.removeWidget(placeholder)
+        placeholder.deleteLater()
+
     def _on_student_selection_changed(self, *_args) -> None:
         try:
             idxs = self.page_students.table.selectionModel().selectedRows()
             if not idxs:
                 self.selected = Selected()
                 return
-            proxy_idx = idxs[0]
-            src_idx = self.students_proxy.mapToSource(proxy_idx)
-            row = self.students_model.row_dict(src_idx.row())
+            row = self.students_model.row_dict(idxs[0].row())
             sid = str((row or {}).get("student_id", "") or "").strip()
             if sid:
                 self.selected = Selected(entity="student", person_id=sid)
@@ -908,7 +1382,7 @@ class MainWindow(QtWidgets.QMainWindow):
         # Make failures visible to the user (Excel locks are very common on Windows).
         msg = str(exc)
         hint = ""
-        if isinstance(exc, PermissionError) or "permission" in msg.lower() or "denied" in msg.lower():
+        if isinstance(exc, PermissionError) or _PERM_RE.search(msg):
             hint = (
                 "\n\nHint: Close 'school_data.xlsx' in Excel/OneDrive preview and try again. "
                 "Windows prevents saving while the file is open."
@@ -919,6 +1393,7 @@ class MainWindow(QtWidgets.QMainWindow):
     def show_page(self, key: str) -> None:
         mapping = {"dashboard": 0, "students": 1, "teachers": 2, "payments": 3, "activity": 4, "settings": 5}
         idx = mapping.get(key, 0)
+        self._ensure_page(key, idx)
         self.pages.setCurrentIndex(idx)
         self.top_title.setText({
             "dashboard": "Dashboard",
@@ -929,10 +1404,15 @@ class MainWindow(QtWidgets.QMainWindow):
             "settings": "Settings",
         }.get(key, "Dashboard"))
 
-        for k, b in self.nav_buttons.items():
-            b.setProperty("active", "true" if k == key else "false")
-            b.style().unpolish(b)
-            b.style().polish(b)
+        if key != self._active_key:
+            # Only the two buttons whose state flips need re-polishing.
+            for k, active in ((self._active_key, "false"), (key, "true")):
+                b = self.nav_buttons.get(k) if k is not None else None
+                if b is not None:
+                    b.setProperty("active", active)
+                    b.style().unpolish(b)
+                    b.style().polish(b)
+            self._active_key = key
 
         if key == "dashboard":
             self.refresh_dashboard()
@@ -948,29 +1428,94 @@ class MainWindow(QtWidgets.QMainWindow):
             self.page_settings.load_settings(self.settings)
 
     # ---------- Live refresh ----------
+    @staticmethod
+    def _data_file_sig() -> tuple[int, int] | None:
+        try:
+            st = os.stat(DATA_XLSX_PATH)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _note_own_write(self) -> None:
+        """Record the workbook's signature after a write made from this window.
+
+        The next _tick then doesn't reload the workbook for a change we made
+        ourselves; the store already keeps its caches current for its own writes.
+        """
+        self._file_sig = self._data_file_sig()
+
+    def _reload_from_disk(self) -> None:
+        """Drop the store's caches and record the workbook's current signature."""
+        self._note_own_write()
+        self.store.invalidate_cache()
+
+    def _watch_data_file(self) -> None:
+        path = str(DATA_XLSX_PATH)
+        if path not in self._fs_watch.files() and os.path.exists(path):
+            self._fs_watch.addPath(path)
+
     def _tick(self) -> None:
         try:
-            p = Path(DATA_XLSX_PATH)
-            if p.exists():
-                m = p.stat().st_mtime
-                if m != self._last_mtime:
-                    self._last_mtime = m
-                    # Reload fresh from disk
-                    self.store.invalidate_cache()
-                    self.refresh_all(rebuild_filters=True)
+            # A save that replaces the file drops the watch; put it back.
+            self._watch_data_file()
+            sig = self._data_file_sig()
+            if sig is not None and sig != self._file_sig and self._reload_thread is None:
+                # Changed outside this window: re-read it off the GUI thread.
+                self._file_sig = sig
+                self._start_reload()
         except Exception as e:
             self.err_logger.log_exception(e, "qt_tick")
 
+    def _start_reload(self) -> None:
+        thread = QtCore.QThread(self)
+        worker = ReloadWorker(self.store, int(self.settings.default_year), int(self.settings.default_month))
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.finished.connect(self._on_reload_done)
+        worker.failed.connect(lambda e: self.err_logger.log_exception(e, "qt_reload"))
+        worker.finished.connect(thread.quit)
+        worker.failed.connect(thread.quit)
+        thread.finished.connect(worker.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+        thread.finished.connect(self._on_reload_thread_done)
+        # Keep the worker referenced until its thread is done with it.
+        self._reload_thread = thread
+        self._reload_worker = worker
+        thread.start()
+
+    def _on_reload_thread_done(self) -> None:
+        self._reload_thread = None
+        self._reload_worker = None
+
+    def _on_reload_done(self, students: list, teachers: list, version: int) -> None:
+        # The store's caches are warm now; the GUI thread only rebuilds models.
+        if version != self.store.version:
+            # We wrote in the meantime: the worker's rows are stale, use the store's.
+            students = teachers = None
+        self.refresh_dashboard(students=students, teachers=teachers)
+        self.refresh_students(rebuild_filters=True, rows=students)
+        self.refresh_teachers(rows=teachers)
+
     # ---------- Data refresh ----------
     def refresh_all(self, *, rebuild_filters: bool) -> None:
-        self.refresh_dashboard()
-        self.refresh_students(rebuild_filters=rebuild_filters)
-        self.refresh_teachers()
-
-    def refresh_dashboard(self) -> None:
+        # One copy of each list per cycle, shared by the dashboard and the tables.
+        students = self.store.list_students()
+        teachers = self.store.list_teachers()
+        self.refresh_dashboard(students=students, teachers=teachers)
+        self.refresh_students(rebuild_filters=rebuild_filters, rows=students)
+        self.refresh_teachers(rows=teachers)
+
+    def refresh_dashboard(
+        self,
+        *,
+        students: list[dict[str, Any]] | None = None,
+        teachers: list[dict[str, Any]] | None = None,
+    ) -> None:
         try:
-            students = self.store.list_students()
-            teachers = self.store.list_teachers()
+            if students is None:
+                students = self.store.list_students()
+            if teachers is None:
+                teachers = self.store.list_teachers()
 
             year = int(self.settings.default_year)
             month = int(self.settings.default_month)
@@ -987,55 +1532,86 @@ class MainWindow(QtWidgets.QMainWindow):
             )
 
             # Students by class
-            cc: dict[str, int] = {}
-            for r in students:
-                c = str(r.get("class", "") or "").strip() or "(None)"
-                cc[c] = cc.get(c, 0) + 1
-            # Keep top 10 for a clean chart
-            items = sorted(cc.items(), key=lambda kv: (-kv[1], kv[0]))[:10]
-            self.page_dashboard.set_classes_chart({k: v for k, v in items})
+            cc = Counter(str(r.get("class") or "").strip() or "(None)" for r in students)
+            # Keep top 10 for a clean chart; unlike most_common, ties stay alphabetical.
+            items = heapq.nsmallest(10, cc.items(), key=lambda kv: (-kv[1], kv[0]))
+            self.page_dashboard.set_classes_chart(dict(items))
         except Exception as e:
             self.err_logger.log_exception(e, "qt_refresh_dashboard")
 
-    def refresh_students(self, *, rebuild_filters: bool) -> None:
+    def refresh_students(self, *, rebuild_filters: bool, rows: list[dict[str, Any]] | None = None) -> None:
         try:
             keep_id = self.selected.person_id if self.selected.entity == "student" else ""
 
-            rows = self.store.list_students()
-            rows.sort(key=lambda r: str(r.get("student_id", "") or ""))
+            if rows is None:
+                rows = self.store.list_students()
             self.students_model.set_rows(rows)
 
             if rebuild_filters:
-                classes = sorted({str(r.get("class", "") or "").strip() for r in rows if str(r.get("class", "") or "").strip()})
-                sections = sorted({str(r.get("section", "") or "").strip() for r in rows if str(r.get("section", "") or "").strip()})
-
-                self._refill_combo(self.page_students.cls, "(All classes)", classes)
-                self._refill_combo(self.page_students.sec, "(All sections)", sections)
+                self._refill_student_combos()
 
             self._apply_student_filters()
 
             if keep_id:
                 self._select_student_by_id(keep_id)
 
-            self.statusBar().showMessage(f"Students loaded: {len(rows)}")
+            self._set_status(f"Students loaded: {len(rows)}")
         except Exception as e:
             self.err_logger.log_exception(e, "qt_refresh_students")
 
+    def _refill_student_combos(self) -> None:
+        self._refill_combo(self.page_students.cls, "(All classes)", self.students_model.distinct("class_norm"))
+        self._refill_combo(self.page_students.sec, "(All sections)", self.students_model.distinct("section_norm"))
+
+    def _student_saved(self, sid: str) -> None:
+        """Apply one student's add/edit/delete to the table without a full reload."""
+        self._note_own_write()
+        row = self.store.get_student(sid)
+        if row is None:
+            self.students_model.remove_row(sid)
+            refill = True
+        else:
+            self.students_model.upsert_row(row)
+            cls = str(row.get("class", "") or "").strip()
+            sec = str(row.get("section", "") or "").strip()
+            # Only a class/section value the combos don't list yet needs a rebuild.
+            refill = (cls and self.page_students.cls.findText(cls) < 0) or (sec and self.page_students.sec.findText(sec) < 0)
+        if refill:
+            self._refill_student_combos()
+            # A combo may have fallen back to "(All ...)" while its signals were blocked.
+            self._apply_student_filters()
+        self.refresh_dashboard()
+
+    def _teacher_saved(self, tid: str) -> None:
+        """Apply one teacher's add/edit/delete to the table without a full reload."""
+        self._note_own_write()
+        row = self.store.get_teacher(tid)
+        if row is None:
+            self.teachers_model.remove_row(tid)
+        else:
+            self.teachers_model.upsert_row(row)
+        self.refresh_dashboard()
+
     def _refill_combo(self, combo: QtWidgets.QComboBox, first: str, values: list[str]) -> None:
+        items = [first, *values]
+        if self._combo_items.get(combo) == items:
+            return
+        self._combo_items[combo] = items
         cur = combo.currentText()
-        combo.blockSignals(True)
-        combo.clear()
-        combo.addItem(first)
-        for v in values:
-            combo.addItem(v)
-        if cur and (cur == first or cur in values):
-            combo.setCurrentText(cur)
-        else:
-            combo.setCurrentIndex(0)
-        combo.blockSignals(False)
+        # Programmatic refill: no per-item filter passes. Callers apply filters once after.
+        was_blocked = combo.blockSignals(True)
+        try:
+            combo.clear()
+            combo.addItems(items)
+            if cur and (cur == first or cur in values):
+                combo.setCurrentText(cur)
+            else:
+                combo.setCurrentIndex(0)
+        finally:
+            combo.blockSignals(was_blocked)
 
     def _apply_student_filters(self) -> None:
-        self.students_proxy.set_filters(
+        self.students_model.apply_filters(
             search=self.page_students.search.text(),
             field=self.page_students.field.currentText(),
             cls=self.page_students.cls.currentText(),
@@ -1043,39 +1619,56 @@ class MainWindow(QtWidgets.QMainWindow):
         )
 
     def _select_student_by_id(self, student_id: str) -> None:
-        # Search in source rows then map to proxy index.
-        for r in range(self.students_model.rowCount()):
-            row = self.students_model.row_dict(r) or {}
-            if str(row.get("student_id", "") or "").strip() == student_id:
-                src = self.students_model.index(r, 0)
-                proxy = self.students_proxy.mapFromSource(src)
-                if proxy.isValid():
-                    self.page_students.table.selectRow(proxy.row())
-                    self.page_students.table.scrollTo(proxy)
-                break
+        row = self.students_model.row_of(student_id)
+        if row is None:
+            return
+        table = self.page_students.table
+        cur = table.selectionModel().selectedRows()
+        if cur and cur[0].row() == row:
+            # Already selected: skip the selection change and viewport repaint.
+            return
+        table.selectRow(row)
+        table.scrollTo(self.students_model.index(row, 0))
 
     # ---------- CRUD ----------
-    def _next_id(self, prefix: str, existing_ids: list[str]) -> str:
-        max_n = 0
-        for eid in existing_ids:
-            if not eid.startswith(prefix):
-                continue
-            tail = eid[len(prefix) :]
-            digits = "".join(ch for ch in tail if ch.isdigit())
-            if digits:
-                try:
-                    max_n = max(max_n, int(digits))
-                except Exception:
-                    pass
-        return f"{prefix}{max_n + 1:04d}"
-
     def _emit(self, action: str, entity_type: str, entity_id: str, details: str = "") -> None:
-        self.store.add_event(AppEvent(timestamp=now_ts(), action=action, entity_type=entity_type, entity_id=entity_id, details=details))
+        self._event_queue.put(AppEvent(timestamp=now_ts(), action=action, entity_type=entity_type, entity_id=entity_id, details=details))
+        if self._events_closed:
+            self._drain_events()
+            return
+        self._event_pool.submit(self._drain_events)
+
+    def _drain_events(self) -> None:
+        # Runs on the event thread (inline after closeEvent). Whatever queued up since
+        # the last drain is written with one save; later drains find the queue empty.
+        events: list[AppEvent] = []
+        while True:
+            try:
+                events.append(self._event_queue.get_nowait())
+            except queue.Empty:
+                break
+        if not events:
+            return
+        try:
+            self.store.add_events(events)
+            # Hand the signature to the GUI thread, which owns _file_sig.
+            self.events_saved.emit(self._data_file_sig())
+        except Exception as e:
+            self.err_logger.log_exception(e, "qt_add_events")
+
+    def _on_events_saved(self, sig: tuple[int, int] | None) -> None:
+        # Our own save: the file watcher mustn't treat it as an external change.
+        self._file_sig = sig
+
+    def closeEvent(self, event: QtGui.QCloseEvent) -> None:  # noqa: N802
+        # Let queued activity events reach the workbook before the app exits.
+        self._events_closed = True
+        self._event_pool.shutdown(wait=True)
+        super().closeEvent(event)
 
     def add_student(self) -> None:
         try:
-            existing = [str(s.get("student_id", "") or "") for s in self.store.list_students()]
-            sid = self._next_id(self.settings.student_id_prefix, existing)
+            sid = self.store.next_student_id(self.settings.student_id_prefix)
 
             dlg = StudentDialog(
                 self,
@@ -1090,9 +1683,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
             self.store.upsert_student(data)
             self._emit("add_student", "student", sid, f"{data.get('first_name','')} {data.get('last_name','')}".strip())
-            # Force UI to reflect what's actually in the xlsx on disk.
-            self.store.invalidate_cache()
-            self.refresh_all(rebuild_filters=True)
+            self._student_saved(sid)
             self.selected = Selected(entity="student", person_id=sid)
             self._select_student_by_id(sid)
         except Exception as e:
@@ -1100,10 +1691,8 @@ class MainWindow(QtWidgets.QMainWindow):
             self._show_error("Add student failed", e)
 
     def _get_student(self, sid: str) -> dict[str, Any] | None:
-        for r in self.store.list_students():
-            if str(r.get("student_id", "") or "").strip() == sid:
-                return r
-        return None
+        r = self.students_model.get(sid)
+        return dict(r) if r is not None else None
 
     def edit_student(self) -> None:
         try:
@@ -1125,8 +1714,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
             self.store.upsert_student(data)
             self._emit("edit_student", "student", sid, "updated")
-            self.store.invalidate_cache()
-            self.refresh_all(rebuild_filters=True)
+            self._student_saved(sid)
             self.selected = Selected(entity="student", person_id=sid)
             self._select_student_by_id(sid)
         except Exception as e:
@@ -1144,19 +1732,18 @@ class MainWindow(QtWidgets.QMainWindow):
             if ok:
                 self._emit("delete_student", "student", sid, "deleted")
             self.selected = Selected()
-            self.store.invalidate_cache()
-            self.refresh_all(rebuild_filters=True)
+            self._student_saved(sid)
         except Exception as e:
             self.err_logger.log_exception(e, "qt_delete_student")
             self._show_error("Delete student failed", e)
 
     # ---------- Teachers CRUD ----------
-    def refresh_teachers(self) -> None:
+    def refresh_teachers(self, *, rows: list[dict[str, Any]] | None = None) -> None:
         try:
             keep_id = self.selected.person_id if self.selected.entity == "teacher" else ""
 
-            rows = self.store.list_teachers()
-            rows.sort(key=lambda r: str(r.get("teacher_id", "") or ""))
+            if rows is None:
+                rows = self.store.list_teachers()
             self.teachers_model.set_rows(rows)
 
             self._apply_teacher_filter()
@@ -1164,36 +1751,34 @@ class MainWindow(QtWidgets.QMainWindow):
             if keep_id:
                 self._select_teacher_by_id(keep_id)
 
-            self.statusBar().showMessage(f"Teachers loaded: {len(rows)}")
+            self._set_status(f"Teachers loaded: {len(rows)}")
         except Exception as e:
             self.err_logger.log_exception(e, "qt_refresh_teachers")
 
     def _apply_teacher_filter(self) -> None:
-        search = self.page_teachers.search.text().lower()
-        for row in range(self.teachers_proxy.sourceModel().rowCount()):
-            show = True
-            if search:
-                row_dict = self.teachers_model.row_dict(row) or {}
-                blob = " ".join(str(v or "") for v in row_dict.values()).lower()
-                if search not in blob:
-                    show = False
-            self.page_teachers.table.setRowHidden(row, not show)
+        self.teachers_proxy.set_search(self.page_teachers.search.text())
 
     def _select_teacher_by_id(self, teacher_id: str) -> None:
-        for r in range(self.teachers_model.rowCount()):
-            row = self.teachers_model.row_dict(r) or {}
-            if str(row.get("teacher_id", "") or "").strip() == teacher_id:
-                self.page_teachers.table.selectRow(r)
-                self.page_teachers.table.scrollToBottom()
-                break
+        r = self.teachers_model.row_for_id(teacher_id)
+        if r is None:
+            return
+        proxy = self.teachers_proxy.mapFromSource(self.teachers_model.index(r, 0))
+        if not proxy.isValid():
+            return
+        table = self.page_teachers.table
+        cur = table.selectionModel().selectedRows()
+        if cur and cur[0].row() == proxy.row():
+            return
+        table.selectRow(proxy.row())
+        table.scrollTo(proxy)
 
     def _on_teacher_selection_changed(self, *_args) -> None:
         try:
             idxs = self.page_teachers.table.selectionModel().selectedRows()
             if not idxs:
                 return
-            idx = idxs[0]
-            row = self.teachers_model.row_dict(idx.row())
+            src_idx = self.teachers_proxy.mapToSource(idxs[0])
+            row = self.teachers_model.row_dict(src_idx.row())
             tid = str((row or {}).get("teacher_id", "") or "").strip()
             if tid:
                 self.selected = Selected(entity="teacher", person_id=tid)
@@ -1201,15 +1786,12 @@ class MainWindow(QtWidgets.QMainWindow):
             self.err_logger.log_exception(e, "qt_teacher_selection")
 
     def _get_teacher(self, tid: str) -> dict[str, Any] | None:
-        for r in self.store.list_teachers():
-            if str(r.get("teacher_id", "") or "").strip() == tid:
-                return r
-        return None
+        r = self.teachers_model.get(tid)
+        return dict(r) if r is not None else None
 
     def add_teacher(self) -> None:
         try:
-            existing = [str(t.get("teacher_id", "") or "") for t in self.store.list_teachers()]
-            tid = self._next_id(self.settings.teacher_id_prefix, existing)
+            tid = self.store.next_teacher_id(self.settings.teacher_id_prefix)
 
             dlg = TeacherDialog(
                 self,
@@ -1224,8 +1806,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
             self.store.upsert_teacher(data)
             self._emit("add_teacher", "teacher", tid, f"{data.get('first_name','')} {data.get('last_name','')}".strip())
-            self.store.invalidate_cache()
-            self.refresh_all(rebuild_filters=True)
+            self._teacher_saved(tid)
             self.selected = Selected(entity="teacher", person_id=tid)
             self._select_teacher_by_id(tid)
         except Exception as e:
@@ -1252,8 +1833,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
             self.store.upsert_teacher(data)
             self._emit("edit_teacher", "teacher", tid, "updated")
-            self.store.invalidate_cache()
-            self.refresh_all(rebuild_filters=True)
+            self._teacher_saved(tid)
             self.selected = Selected(entity="teacher", person_id=tid)
             self._select_teacher_by_id(tid)
         except Exception as e:
@@ -1271,8 +1851,7 @@ class MainWindow(QtWidgets.QMainWindow):
             if ok:
                 self._emit("delete_teacher", "teacher", tid, "deleted")
             self.selected = Selected()
-            self.store.invalidate_cache()
-            self.refresh_all(rebuild_filters=True)
+            self._teacher_saved(tid)
         except Exception as e:
             self.err_logger.log_exception(e, "qt_delete_teacher")
             self._show_error("Delete teacher failed", e)
@@ -1316,7 +1895,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
             self.store.set_payment(entity_text, person_id, year, month, data["status"], data["amount"])
             self._emit("set_payment", entity_text, person_id, f"{MONTHS[month-1]} {year}: {data['status']} ${data['amount']}")
-            self.store.invalidate_cache()
+            self._reload_from_disk()
             self.refresh_payments()
         except Exception as e:
             self.err_logger.log_exception(e, "qt_set_payment")
@@ -1326,6 +1905,9 @@ class MainWindow(QtWidgets.QMainWindow):
     def refresh_activity(self) -> None:
         self.page_activity.refresh_activity(self.store)
 
+    def _apply_activity_filters(self) -> None:
+        self.page_activity.apply_filters()
+
     # ---------- Settings ----------
     def save_settings(self) -> None:
         try:
@@ -1344,7 +1926,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
             QtWidgets.QMessageBox.information(self, "Success", "Settings saved successfully!")
             self._emit("update_settings", "settings", "", "saved")
-            self.store.invalidate_cache()
+            self._reload_from_disk()
             self.refresh_all(rebuild_filters=True)
         except Exception as e:
             self.err_logger.log_exception(e, "qt_save_settings")
@@ -1,6 +1,7 @@
 """Additional Qt page widgets for payments, activity, and settings."""
 from __future__ import annotations
 
+import functools
 from datetime import datetime
 from typing import Any
 
@@ -14,6 +15,13 @@ MONTHS = [
     "January", "February", "March", "April", "May", "June",
     "July", "August", "September", "October", "November", "December"
 ]
+MONTHS_ABBR = tuple(m[:3] for m in MONTHS)
+
+
+@functools.lru_cache(maxsize=2048)
+def _fmt_ym(year: int, month: int) -> str:
+    """``"Jan 2025"``-style label; the same few dozen months repeat across every row."""
+    return f"{MONTHS_ABBR[month-1]} {year}"
 
 
 class PaymentDialog(QtWidgets.QDialog):
@@ -67,6 +75,162 @@ class PaymentDialog(QtWidgets.QDialog):
         }
 
 
+class PaymentsTableModel(QtCore.QAbstractTableModel):
+    """Read-only payments grid over the row dicts built by PaymentsPage.refresh_payments."""
+    COLUMNS = ["ID", "Name", "Status", "Amount", "Pending Total", "Pending Months"]
+    STATUS_COL = 2
+
+    PAID_BG = QtGui.QColor(34, 211, 153, 100)
+    PENDING_BG = QtGui.QColor(225, 29, 72, 100)
+
+    def __init__(self, parent: QtCore.QObject | None = None):
+        super().__init__(parent)
+        self._rows: list[dict[str, Any]] = []
+        # Cell strings per row, formatted once per refresh instead of per paint.
+        self._cells: list[tuple[str, ...]] = []
+        self._paid: list[bool] = []
+
+    @staticmethod
+    def _display(r: dict[str, Any]) -> tuple[str, ...]:
+        return (
+            r["id"],
+            r["name"],
+            r["status"],
+            f"${r['amount']:,.2f}",
+            f"${r['pending_total']:,.2f}",
+            r["pending_months"] or "-",
+        )
+
+    def set_rows(self, rows: list[dict[str, Any]]) -> None:
+        self.beginResetModel()
+        self._rows = rows
+        self._cells = [self._display(r) for r in rows]
+        self._paid = [r["status"].lower() == "paid" for r in rows]
+        self.endResetModel()
+
+    def is_paid(self, row: int) -> bool:
+        return self._paid[row]
+
+    def row_dict(self, row: int) -> dict[str, Any] | None:
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def headerData(self, section: int, orientation: QtCore.Qt.Orientation, role: int = QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal and 0 <= section < len(self.COLUMNS):
+            return self.COLUMNS[section]
+        return None
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.DisplayRole):
+        if not index.isValid() or not (0 <= index.row() < len(self._rows)):
+            return None
+        col = index.column()
+        if role == QtCore.Qt.DisplayRole:
+            cells = self._cells[index.row()]
+            return cells[col] if 0 <= col < len(cells) else None
+        if role == QtCore.Qt.BackgroundRole and col == self.STATUS_COL:
+            return self.PAID_BG if self._paid[index.row()] else self.PENDING_BG
+        return None
+
+
+class PaymentsFilterProxyModel(QtCore.QSortFilterProxyModel):
+    """All/Paid/Pending filter over PaymentsTableModel's per-row paid flags."""
+
+    def __init__(self, parent: QtCore.QObject | None = None):
+        super().__init__(parent)
+        self._status = "All"
+
+    def set_status(self, status: str) -> None:
+        if status == self._status:
+            return
+        self._status = status
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QtCore.QModelIndex) -> bool:  # noqa: N802
+        if self._status == "All":
+            return True
+        return self.sourceModel().is_paid(source_row) == (self._status == "Paid")
+
+
+class ActivityTableModel(QtCore.QAbstractTableModel):
+    """Read-only activity grid over event dicts from ExcelStore.list_events."""
+    COLUMNS = ["Timestamp", "Action", "Entity Type", "Entity ID", "Details"]
+    KEYS = ("timestamp", "action", "entity_type", "entity_id", "details")
+
+    def __init__(self, parent: QtCore.QObject | None = None):
+        super().__init__(parent)
+        self._cells: list[tuple[str, ...]] = []
+        # Lowercased "entity_id details" per row, for ActivityFilterProxyModel.
+        self._blobs: list[str] = []
+
+    def set_rows(self, events: list[dict[str, Any]]) -> None:
+        self.beginResetModel()
+        self._cells = [tuple(str(ev.get(k, "")) for k in self.KEYS) for ev in events]
+        self._blobs = [f"{c[3]} {c[4]}".lower() for c in self._cells]
+        self.endResetModel()
+
+    def action(self, row: int) -> str:
+        return self._cells[row][1]
+
+    def search_blob(self, row: int) -> str:
+        return self._blobs[row]
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._cells)
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def headerData(self, section: int, orientation: QtCore.Qt.Orientation, role: int = QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal and 0 <= section < len(self.COLUMNS):
+            return self.COLUMNS[section]
+        return None
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.DisplayRole):
+        if role != QtCore.Qt.DisplayRole or not index.isValid() or not (0 <= index.row() < len(self._cells)):
+            return None
+        cells = self._cells[index.row()]
+        col = index.column()
+        return cells[col] if 0 <= col < len(cells) else None
+
+
+class ActivityFilterProxyModel(QtCore.QSortFilterProxyModel):
+    """Action and text filter over ActivityTableModel's cached cells."""
+
+    def __init__(self, parent: QtCore.QObject | None = None):
+        super().__init__(parent)
+        self._action = "All"
+        self._needle = ""
+
+    def set_filters(self, action: str, text: str) -> None:
+        needle = text.strip().lower()
+        if (action, needle) == (self._action, self._needle):
+            return
+        self._action = action
+        self._needle = needle
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QtCore.QModelIndex) -> bool:  # noqa: N802
+        src = self.sourceModel()
+        if self._action != "All" and src.action(source_row) != self._action:
+            return False
+        return not self._needle or self._needle in src.search_blob(source_row)
+
+
+def _size_columns_once(table: QtWidgets.QTableView) -> None:
+    """Fit columns to the first non-empty load only; later refreshes keep the user's widths."""
+    if table.property("sized") or table.model().rowCount() == 0:
+        return
+    table.resizeColumnsToContents()
+    table.setProperty("sized", True)
+
+
 class PaymentsPage(QtWidgets.QWidget):
     """Comprehensive payment tracking: student fees and teacher salaries with filtering, rollover display."""
     def __init__(self, parent: QtWidgets.QWidget, main_window):
@@ -123,9 +287,12 @@ class PaymentsPage(QtWidgets.QWidget):
         root.addWidget(summary_card)
 
         # Table
-        self.table = QtWidgets.QTableWidget()
-        self.table.setColumnCount(6)
-        self.table.setHorizontalHeaderLabels(["ID", "Name", "Status", "Amount", "Pending Total", "Pending Months"])
+        self.model = PaymentsTableModel(self)
+        # The status filter runs in the proxy, so changing it doesn't rebuild the rows.
+        self.proxy = PaymentsFilterProxyModel(self)
+        self.proxy.setSourceModel(self.model)
+        self.table = QtWidgets.QTableView()
+        self.table.setModel(self.proxy)
         self.table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
         self.table.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
         self.table.horizontalHeader().setStretchLastSection(True)
@@ -133,18 +300,40 @@ class PaymentsPage(QtWidgets.QWidget):
         self.table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
         root.addWidget(self.table, 1)
 
+        # Paid/pending totals from the last refresh; see _update_summary.
+        self._summary: tuple[str, int, float, int, float] | None = None
+        self.filter_combo.currentTextChanged.connect(self.apply_filter)
+
+    def apply_filter(self, *_args) -> None:
+        """Apply the All/Paid/Pending filter to the rows already loaded."""
+        self.proxy.set_status(self.filter_combo.currentText())
+        self._update_summary()
+
+    def _update_summary(self) -> None:
+        if self._summary is None:
+            return
+        heading, paid_count, paid_amount, pending_count, pending_amount = self._summary
+        status = self.filter_combo.currentText()
+        if status == "Paid":
+            pending_count, pending_amount = 0, 0.0
+        elif status == "Pending":
+            paid_count, paid_amount = 0, 0.0
+        self.lbl_summary.setText(
+            f"{heading}: "
+            f"Paid: {paid_count} (${paid_amount:,.2f}) | "
+            f"Pending: {pending_count} (${pending_amount:,.2f})"
+        )
+
     def refresh_payments(self, store: ExcelStore, settings: Settings) -> None:
-        """Load payment data for selected month/year/entity with status filtering."""
+        """Load payment data for the selected month/year/entity; the status filter is applied by the proxy."""
         try:
             entity_text = self.entity_combo.currentText().lower().rstrip("s")  # "Students" -> "student"
             month = self.month_combo.currentIndex() + 1
             year = int(self.year_spin.value())
-            filter_status = self.filter_combo.currentText()
 
             default_amt = settings.default_student_fee if entity_text == "student" else settings.default_teacher_salary
 
-            people = store.list_students() if entity_text == "student" else store.list_teachers()
-            id_key = "student_id" if entity_text == "student" else "teacher_id"
+            people = store.people_names(entity_text)
 
             # Build table data
             table_data: list[dict[str, Any]] = []
@@ -153,33 +342,22 @@ class PaymentsPage(QtWidgets.QWidget):
             total_paid_amount = 0.0
             total_pending_amount = 0.0
 
-            for p in people:
-                pid = str(p.get(id_key, "") or "")
-                if not pid:
-                    continue
-
-                name = f"{p.get('first_name','') or ''} {p.get('last_name','') or ''}".strip()
-
+            for pid, name in people:
                 # Get current month payment
                 rec = store.get_payment_record(entity_text, pid, year, month)
                 status = str(rec.get("status", "Pending") or "Pending")
                 amount = float(rec.get("amount", 0) or 0)
                 if amount <= 0:
                     amount = default_amt
+                paid = status.lower() == "paid"
 
                 # Get total pending (all unpaid months up to now)
                 pending_months = store.get_pending_months(entity_text, pid, year, month, default_amt)
                 pending_total = sum(pm["amount"] for pm in pending_months)
-                pending_months_str = ", ".join([f"{MONTHS[pm['month']-1][:3]} {pm['year']}" for pm in pending_months[-6:]])  # last 6
+                pending_months_str = ", ".join([_fmt_ym(pm["year"], pm["month"]) for pm in pending_months[-6:]])  # last 6
                 if len(pending_months) > 6:
                     pending_months_str = f"...{pending_months_str}"
 
-                # Apply filter
-                if filter_status == "Paid" and status.lower() != "paid":
-                    continue
-                if filter_status == "Pending" and status.lower() == "paid":
-                    continue
-
                 table_data.append({
                     "id": pid,
                     "name": name,
@@ -189,39 +367,25 @@ class PaymentsPage(QtWidgets.QWidget):
                     "pending_months": pending_months_str,
                 })
 
-                if status.lower() == "paid":
+                if paid:
                     total_paid_count += 1
                     total_paid_amount += amount
                 else:
                     total_pending_count += 1
                     total_pending_amount += amount
 
-            # Update summary
             entity_label = "Students" if entity_text == "student" else "Teachers"
-            self.lbl_summary.setText(
-                f"{entity_label} {MONTHS[month-1]} {year}: "
-                f"Paid: {total_paid_count} (${total_paid_amount:,.2f}) | "
-                f"Pending: {total_pending_count} (${total_pending_amount:,.2f})"
+            self._summary = (
+                f"{entity_label} {MONTHS[month-1]} {year}",
+                total_paid_count,
+                total_paid_amount,
+                total_pending_count,
+                total_pending_amount,
             )
 
-            # Populate table
-            self.table.setRowCount(len(table_data))
-            for row_idx, row_data in enumerate(table_data):
-                self.table.setItem(row_idx, 0, QtWidgets.QTableWidgetItem(row_data["id"]))
-                self.table.setItem(row_idx, 1, QtWidgets.QTableWidgetItem(row_data["name"]))
-
-                status_item = QtWidgets.QTableWidgetItem(row_data["status"])
-                if row_data["status"].lower() == "paid":
-                    status_item.setBackground(QtGui.QColor(34, 211, 153, 100))
-                else:
-                    status_item.setBackground(QtGui.QColor(225, 29, 72, 100))
-                self.table.setItem(row_idx, 2, status_item)
-
-                self.table.setItem(row_idx, 3, QtWidgets.QTableWidgetItem(f"${row_data['amount']:,.2f}"))
-                self.table.setItem(row_idx, 4, QtWidgets.QTableWidgetItem(f"${row_data['pending_total']:,.2f}"))
-                self.table.setItem(row_idx, 5, QtWidgets.QTableWidgetItem(row_data["pending_months"] or "-"))
-
-            self.table.resizeColumnsToContents()
+            self.model.set_rows(table_data)
+            self.apply_filter()
+            _size_columns_once(self.table)
         except Exception as e:
             self.main_window.err_logger.log_exception(e, "qt_refresh_payments")
 
@@ -230,12 +394,10 @@ class PaymentsPage(QtWidgets.QWidget):
         rows = self.table.selectionModel().selectedRows()
         if not rows:
             return None
-        row = rows[0].row()
-        pid = self.table.item(row, 0).text() if self.table.item(row, 0) else ""
-        name = self.table.item(row, 1).text() if self.table.item(row, 1) else ""
-        if not pid:
+        rec = self.model.row_dict(self.proxy.mapToSource(rows[0]).row())
+        if not rec or not rec["id"]:
             return None
-        return (pid, name)
+        return (rec["id"], rec["name"])
 
 
 class ActivityPage(QtWidgets.QWidget):
@@ -263,40 +425,28 @@ class ActivityPage(QtWidgets.QWidget):
         cly.addStretch(1)
         root.addWidget(controls)
 
-        self.table = QtWidgets.QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels(["Timestamp", "Action", "Entity Type", "Entity ID", "Details"])
+        self.model = ActivityTableModel(self)
+        # Action/search filtering runs in the proxy over the loaded events.
+        self.proxy = ActivityFilterProxyModel(self)
+        self.proxy.setSourceModel(self.model)
+        self.table = QtWidgets.QTableView()
+        self.table.setModel(self.proxy)
         self.table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
         self.table.horizontalHeader().setStretchLastSection(True)
         self.table.verticalHeader().setVisible(False)
         self.table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
         root.addWidget(self.table, 1)
 
+    def apply_filters(self, *_args) -> None:
+        """Apply the action and search filters to the events already loaded."""
+        self.proxy.set_filters(self.filter_action.currentText(), self.search.text())
+
     def refresh_activity(self, store: ExcelStore) -> None:
         try:
             events = store.list_events(limit=500)
-            filter_action = self.filter_action.currentText()
-            search_text = self.search.text().strip().lower()
-
-            filtered: list[dict[str, Any]] = []
-            for ev in reversed(events):
-                if filter_action != "All" and ev.get("action", "") != filter_action:
-                    continue
-                if search_text:
-                    blob = f"{ev.get('entity_id','')} {ev.get('details','')}".lower()
-                    if search_text not in blob:
-                        continue
-                filtered.append(ev)
-
-            self.table.setRowCount(len(filtered))
-            for row_idx, ev in enumerate(filtered):
-                self.table.setItem(row_idx, 0, QtWidgets.QTableWidgetItem(str(ev.get("timestamp", ""))))
-                self.table.setItem(row_idx, 1, QtWidgets.QTableWidgetItem(str(ev.get("action", ""))))
-                self.table.setItem(row_idx, 2, QtWidgets.QTableWidgetItem(str(ev.get("entity_type", ""))))
-                self.table.setItem(row_idx, 3, QtWidgets.QTableWidgetItem(str(ev.get("entity_id", ""))))
-                self.table.setItem(row_idx, 4, QtWidgets.QTableWidgetItem(str(ev.get("details", ""))))
-
-            self.table.resizeColumnsToContents()
+            self.model.set_rows(events[::-1])
+            self.apply_filters()
+            _size_columns_once(self.table)
         except Exception as e:
             pass
 
@@ -416,8 +566,8 @@ class SettingsPage(QtWidgets.QWidget):
         self.default_year.setValue(settings.default_year)
 
     def get_settings(self) -> Settings:
-        def parse_fields(text: str) -> list[str]:
-            return [f.strip() for f in text.split(",") if f.strip()]
+        def parse_fields(text: str) -> tuple[str, ...]:
+            return tuple(f.strip() for f in text.split(",") if f.strip())
 
         return Settings(
             student_id_prefix=self.student_prefix.text().strip(),
@@ -1,19 +1,26 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+try:  # Optional: faster JSON encode/decode (falls back to the stdlib json module).
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
 from .constants import SETTINGS_JSON_PATH
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Settings:
+    """Immutable snapshot of settings.json; use dataclasses.replace to change a value."""
+
     student_id_prefix: str = "STU-"
     teacher_id_prefix: str = "TCH-"
-    student_custom_fields: list[str] = field(default_factory=list)
-    teacher_custom_fields: list[str] = field(default_factory=list)
+    student_custom_fields: tuple[str, ...] = ()
+    teacher_custom_fields: tuple[str, ...] = ()
     default_year: int = 2026
     default_month: int = 1
     appearance_mode: str = "Light"  # Light | Dark | System
@@ -44,8 +51,8 @@ class Settings:
         return Settings(
             student_id_prefix=str(d.get("student_id_prefix", "STU-")),
             teacher_id_prefix=str(d.get("teacher_id_prefix", "TCH-")),
-            student_custom_fields=list(d.get("student_custom_fields", [])),
-            teacher_custom_fields=list(d.get("teacher_custom_fields", [])),
+            student_custom_fields=tuple(d.get("student_custom_fields", ())),
+            teacher_custom_fields=tuple(d.get("teacher_custom_fields", ())),
             default_year=int(d.get("default_year", 2026)),
             default_month=int(d.get("default_month", 1)),
             appearance_mode=str(d.get("appearance_mode", "Light")),
@@ -58,8 +65,8 @@ class Settings:
         return {
             "student_id_prefix": self.student_id_prefix,
             "teacher_id_prefix": self.teacher_id_prefix,
-            "student_custom_fields": self.student_custom_fields,
-            "teacher_custom_fields": self.teacher_custom_fields,
+            "student_custom_fields": list(self.student_custom_fields),
+            "teacher_custom_fields": list(self.teacher_custom_fields),
             "default_year": self.default_year,
             "default_month": self.default_month,
             "appearance_mode": self.appearance_mode,
@@ -79,12 +86,17 @@ class SettingsStore:
             self.save(settings)
             return settings
 
-        with self.path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        raw = self.path.read_bytes()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
         return Settings.from_dict(data if isinstance(data, dict) else {})
 
     def save(self, settings: Settings) -> None:
+        if orjson is not None:
+            data = orjson.dumps(settings.to_dict(), option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        else:
+            data = (json.dumps(settings.to_dict(), indent=2) + "\n").encode("utf-8")
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        with self.path.open("w", encoding="utf-8") as f:
-            json.dump(settings.to_dict(), f, indent=2)
-            f.write("\n")
+        # Write a sibling file and swap it in, so a crash mid-write can't leave a truncated settings.json.
+        tmp = self.path.with_suffix(".json.tmp")
+        tmp.write_bytes(data)
+        tmp.replace(self.path)
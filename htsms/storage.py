@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import functools
+import threading
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -7,6 +9,11 @@ from typing import Any, Iterable
 
 from openpyxl import Workbook, load_workbook
 
+try:  # Optional: native XLSX reader, much faster than openpyxl for cold reads.
+    from python_calamine import CalamineWorkbook
+except ImportError:  # pragma: no cover - depends on the environment
+    CalamineWorkbook = None
+
 from .constants import (
     ACTIVITY_SHEET,
     DATA_XLSX_PATH,
@@ -18,10 +25,57 @@ from .constants import (
 from .logger import AppEvent
 
 
+def _locked(fn):
+    """Serialize access to the workbook; the UI may read while a worker thread writes."""
+
+    @functools.wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return fn(self, *args, **kwargs)
+
+    return wrapper
+
+
+def _calamine_value(v: Any) -> Any:
+    # Match what openpyxl hands back: None for blanks, int for whole numbers.
+    if v == "":
+        return None
+    if isinstance(v, float) and v.is_integer():
+        return int(v)
+    return v
+
+
+def _id_number(person_id: str, prefix: str) -> int | None:
+    """Numeric tail of ids like ``STU-0042`` (``None`` if it doesn't match the prefix)."""
+
+    if not person_id.startswith(prefix):
+        return None
+    tail = person_id[len(prefix) :]
+    if tail.isascii() and tail.isdigit():
+        return int(tail)
+    return None
+
+
 def _iso_now() -> str:
     return datetime.now().isoformat(timespec="seconds")
 
 
+@functools.lru_cache(maxsize=64)
+def _months_back(year: int, month: int, count: int) -> tuple[tuple[int, int], ...]:
+    """``count`` (year, month) pairs ending at year/month, oldest first."""
+
+    out: list[tuple[int, int]] = []
+    y, m = year, month
+    for _ in range(count):
+        out.append((y, m))
+        m -= 1
+        if m < 1:
+            m = 12
+            y -= 1
+    out.reverse()
+    return tuple(out)
+
+
 def _ensure_sheet_headers(ws, headers: list[str]) -> None:
     # If the sheet is empty (or has an empty first row), ensure row 1 contains headers.
     # A common failure mode is: row 1 is blank, headers were appended to row 2; the app
@@ -99,15 +153,51 @@ class ExcelStore:
     def __init__(self, path: Path = DATA_XLSX_PATH):
         self.path = path
         self._wb = None
-
+        self._lock = threading.RLock()
+        # Bumped on every save/invalidate so callers can cheaply tell if cached views are stale.
+        self.version = 0
+        # When True, writes only update the in-memory workbook; call flush() to persist.
+        self.defer_saves = False
+        self._dirty = False
+        # sheet name -> rows as last read; dropped whenever that sheet is written.
+        self._rows_cache: dict[str, list[dict[str, Any]]] = {}
+        # sheet name -> {person id: row dict}; built on first lookup, kept in sync by upsert/delete.
+        self._id_maps: dict[str, dict[str, dict[str, Any]]] = {}
+        # sheet name -> (cached rows it was built from, [(person id, "First Last")]); see people_names.
+        self._names: dict[str, tuple[list[dict[str, Any]], list[tuple[str, str]]]] = {}
+        # (sheet name, prefix) -> highest id number seen; only grows between reloads.
+        self._max_ids: dict[tuple[str, str], int] = {}
+        # entity -> {(person id, year, month): payment row}; first row wins, like the old scan.
+        self._pay_index: dict[str, dict[tuple[str, int, int], dict[str, Any]]] = {}
+        # (entity, year, month) -> {"paid", "pending", "total"}; kept current by set_payment.
+        self._pay_counts: dict[tuple[str, int, int], dict[str, int]] = {}
+        # Activity rows, oldest first; loaded on first use and appended to by add_event.
+        self._events: list[dict[str, Any]] | None = None
+        # Bumped whenever the activity log is reloaded, i.e. it may have changed other than by appending.
+        self.events_epoch = 0
+
+    @_locked
     def invalidate_cache(self) -> None:
         """Force the next operation to re-load the workbook from disk.
 
         This is important for "live" UIs that watch the xlsx file for changes.
+        Deferred writes are flushed first so they are not lost.
         """
+        self.flush()
         self._wb = None
-
-    def ensure_workbook(self, student_custom_fields: list[str], teacher_custom_fields: list[str]) -> None:
+        self._rows_cache.clear()
+        self._pay_index.clear()
+        self._pay_counts.clear()
+        self._id_maps.clear()
+        self._names.clear()
+        self._max_ids.clear()
+        self._events = None
+        self.events_epoch += 1
+        self.version += 1
+
+    @_locked
+    def ensure_workbook(self, student_custom_fields: Iterable[str], teacher_custom_fields: Iterable[str]) -> None:
+        self.flush()
         if self.path.exists():
             wb = load_workbook(self.path)
         else:
@@ -128,7 +218,7 @@ class ExcelStore:
             "secondary_contact",
             "created_at",
             "updated_at",
-        ] + student_custom_fields
+        ] + list(student_custom_fields)
         if STUDENTS_SHEET not in wb.sheetnames:
             ws = wb.create_sheet(STUDENTS_SHEET)
         else:
@@ -146,7 +236,7 @@ class ExcelStore:
             "secondary_contact",
             "created_at",
             "updated_at",
-        ] + teacher_custom_fields
+        ] + list(teacher_custom_fields)
         if TEACHERS_SHEET not in wb.sheetnames:
             ws = wb.create_sheet(TEACHERS_SHEET)
         else:
@@ -179,6 +269,15 @@ class ExcelStore:
         self.path.parent.mkdir(parents=True, exist_ok=True)
         wb.save(self.path)
         self._wb = wb
+        self._rows_cache.clear()
+        self._pay_index.clear()
+        self._pay_counts.clear()
+        self._id_maps.clear()
+        self._names.clear()
+        self._max_ids.clear()
+        self._events = None
+        self.events_epoch += 1
+        self.version += 1
 
     def _load(self):
         if self._wb is not None:
@@ -189,8 +288,21 @@ class ExcelStore:
         return self._wb
 
     def _save(self, wb) -> None:
-        wb.save(self.path)
         self._wb = wb
+        self.version += 1
+        if self.defer_saves:
+            self._dirty = True
+            return
+        wb.save(self.path)
+
+    @_locked
+    def flush(self) -> bool:
+        """Write deferred changes to disk. Returns True if anything was written."""
+        if not self._dirty or self._wb is None:
+            return False
+        self._wb.save(self.path)
+        self._dirty = False
+        return True
 
     @staticmethod
     def _sheet_to_dicts(ws) -> list[dict[str, Any]]:
@@ -203,6 +315,61 @@ class ExcelStore:
             rows.append(d)
         return rows
 
+    def _read_sheet(self, name: str) -> list[dict[str, Any]]:
+        """Rows of a sheet as dicts.
+
+        If the workbook is already loaded (or has unsaved edits) it is the source of
+        truth. Otherwise, read straight from disk with calamine when available, or
+        stream it with a read-only openpyxl workbook, so a reload after an external
+        change doesn't keep a full editable copy of every sheet in memory.
+        """
+        if self._wb is None and self.path.exists():
+            if CalamineWorkbook is not None:
+                try:
+                    raw = CalamineWorkbook.from_path(str(self.path)).get_sheet_by_name(name).to_python()
+                except Exception:
+                    raw = None
+                if raw is not None:
+                    return self._calamine_to_dicts(raw)
+            rows = self._stream_sheet(name)
+            if rows is not None:
+                return rows
+        return self._sheet_to_dicts(self._load()[name])
+
+    def _stream_sheet(self, name: str) -> list[dict[str, Any]] | None:
+        try:
+            wb = load_workbook(self.path, read_only=True, data_only=True)
+        except Exception:
+            return None
+        try:
+            if name not in wb.sheetnames:
+                return None
+            it = wb[name].iter_rows(values_only=True)
+            headers = list(next(it, ()))
+            rows: list[dict[str, Any]] = []
+            for r in it:
+                if all(v is None for v in r):
+                    continue
+                rows.append({headers[i]: r[i] for i in range(min(len(headers), len(r)))})
+            return rows
+        finally:
+            wb.close()
+
+    @staticmethod
+    def _calamine_to_dicts(raw: list[list[Any]]) -> list[dict[str, Any]]:
+        if not raw:
+            return []
+        headers = [_calamine_value(h) for h in raw[0]]
+        width = len(headers)
+        rows: list[dict[str, Any]] = []
+        for r in raw[1:]:
+            values = [_calamine_value(v) for v in r[:width]]
+            if all(v is None for v in values):
+                continue
+            values.extend([None] * (width - len(values)))
+            rows.append(dict(zip(headers, values)))
+        return rows
+
     @staticmethod
     def _find_row_by_id(ws, id_header: str, person_id: str) -> int | None:
         headers = [c.value for c in ws[1]]
@@ -215,21 +382,110 @@ class ExcelStore:
                 return row
         return None
 
+    def _cached_rows(self, sheet: str) -> list[dict[str, Any]]:
+        rows = self._rows_cache.get(sheet)
+        if rows is None:
+            rows = self._rows_cache[sheet] = self._read_sheet(sheet)
+        return rows
+
+    @_locked
     def list_students(self) -> list[dict[str, Any]]:
-        wb = self._load()
-        ws = wb[STUDENTS_SHEET]
-        return self._sheet_to_dicts(ws)
+        return [dict(r) for r in self._cached_rows(STUDENTS_SHEET)]
 
+    @_locked
     def list_teachers(self) -> list[dict[str, Any]]:
-        wb = self._load()
-        ws = wb[TEACHERS_SHEET]
-        return self._sheet_to_dicts(ws)
+        return [dict(r) for r in self._cached_rows(TEACHERS_SHEET)]
+
+    @_locked
+    def count_students(self) -> int:
+        return len(self._cached_rows(STUDENTS_SHEET))
+
+    @_locked
+    def count_teachers(self) -> int:
+        return len(self._cached_rows(TEACHERS_SHEET))
+
+    @_locked
+    def people_names(self, entity: str) -> list[tuple[str, str]]:
+        """(id, "First Last") for every student or teacher with an id, in sheet order.
 
+        Built once per read of the sheet, so callers that only need names
+        don't copy every row the way list_students/list_teachers do.
+        """
+        sheet, id_col = (STUDENTS_SHEET, "student_id") if entity == "student" else (TEACHERS_SHEET, "teacher_id")
+        rows = self._cached_rows(sheet)
+        hit = self._names.get(sheet)
+        if hit is None or hit[0] is not rows:
+            names: list[tuple[str, str]] = []
+            for r in rows:
+                pid = str(r.get(id_col, "") or "")
+                if pid:
+                    names.append((pid, f"{r.get('first_name','') or ''} {r.get('last_name','') or ''}".strip()))
+            hit = self._names[sheet] = (rows, names)
+        return list(hit[1])
+
+    def _id_map(self, sheet: str, id_header: str) -> dict[str, dict[str, Any]]:
+        m = self._id_maps.get(sheet)
+        if m is None:
+            m = {}
+            for r in self._cached_rows(sheet):
+                pid = r.get(id_header)
+                if pid not in (None, ""):
+                    m[str(pid)] = r
+            self._id_maps[sheet] = m
+        return m
+
+    def _sync_id_map(self, sheet: str, ws, headers: list[Any], person_id: str, row: int | None) -> None:
+        m = self._id_maps.get(sheet)
+        if m is None:
+            return
+        if row is None:
+            m.pop(person_id, None)
+            return
+        m[person_id] = {h: ws.cell(row=row, column=col).value for col, h in enumerate(headers, start=1)}
+        for key, n in self._max_ids.items():
+            k = _id_number(person_id, key[1]) if key[0] == sheet else None
+            if k is not None and k > n:
+                self._max_ids[key] = k
+
+    def _next_id(self, sheet: str, id_header: str, prefix: str) -> str:
+        key = (sheet, prefix)
+        n = self._max_ids.get(key)
+        if n is None:
+            n = 0
+            for person_id in self._id_map(sheet, id_header):
+                k = _id_number(person_id, prefix)
+                if k is not None and k > n:
+                    n = k
+            self._max_ids[key] = n
+        return f"{prefix}{n + 1:04d}"
+
+    @_locked
+    def next_student_id(self, prefix: str) -> str:
+        """Suggest the next free student id for ``prefix`` (e.g. ``STU-0043``)."""
+        return self._next_id(STUDENTS_SHEET, "student_id", prefix)
+
+    @_locked
+    def next_teacher_id(self, prefix: str) -> str:
+        """Suggest the next free teacher id for ``prefix`` (e.g. ``TCH-0007``)."""
+        return self._next_id(TEACHERS_SHEET, "teacher_id", prefix)
+
+    @_locked
+    def get_student(self, student_id: str) -> dict[str, Any] | None:
+        r = self._id_map(STUDENTS_SHEET, "student_id").get(student_id)
+        return dict(r) if r is not None else None
+
+    @_locked
+    def get_teacher(self, teacher_id: str) -> dict[str, Any] | None:
+        r = self._id_map(TEACHERS_SHEET, "teacher_id").get(teacher_id)
+        return dict(r) if r is not None else None
+
+    @_locked
     def upsert_student(self, data: dict[str, Any]) -> None:
         wb = self._load()
         ws = wb[STUDENTS_SHEET]
         headers = [c.value for c in ws[1]]
-        row = self._find_row_by_id(ws, "student_id", str(data.get("student_id", "")))
+        person_id = str(data.get("student_id", ""))
+        row = self._find_row_by_id(ws, "student_id", person_id)
         now = _iso_now()
         if row is None:
             # insert
@@ -251,13 +507,18 @@ class ExcelStore:
                     continue
                 if h in data:
                     ws.cell(row=row, column=col, value=data.get(h, ""))
+        self._rows_cache.pop(STUDENTS_SHEET, None)
+        self._drop_pay_counts("student")
+        self._sync_id_map(STUDENTS_SHEET, ws, headers, person_id, row if row is not None else ws.max_row)
         self._save(wb)
 
+    @_locked
     def upsert_teacher(self, data: dict[str, Any]) -> None:
         wb = self._load()
         ws = wb[TEACHERS_SHEET]
         headers = [c.value for c in ws[1]]
-        row = self._find_row_by_id(ws, "teacher_id", str(data.get("teacher_id", "")))
+        person_id = str(data.get("teacher_id", ""))
+        row = self._find_row_by_id(ws, "teacher_id", person_id)
         now = _iso_now()
         if row is None:
             row_values = []
@@ -278,8 +539,12 @@ class ExcelStore:
                     continue
                 if h in data:
                     ws.cell(row=row, column=col, value=data.get(h, ""))
+        self._rows_cache.pop(TEACHERS_SHEET, None)
+        self._drop_pay_counts("teacher")
+        self._sync_id_map(TEACHERS_SHEET, ws, headers, person_id, row if row is not None else ws.max_row)
         self._save(wb)
 
+    @_locked
     def delete_student(self, student_id: str) -> bool:
         wb = self._load()
         ws = wb[STUDENTS_SHEET]
@@ -287,9 +552,13 @@ class ExcelStore:
         if row is None:
             return False
         ws.delete_rows(row, 1)
+        self._rows_cache.pop(STUDENTS_SHEET, None)
+        self._drop_pay_counts("student")
+        self._sync_id_map(STUDENTS_SHEET, ws, [], student_id, None)
         self._save(wb)
         return True
 
+    @_locked
     def delete_teacher(self, teacher_id: str) -> bool:
         wb = self._load()
         ws = wb[TEACHERS_SHEET]
@@ -297,25 +566,44 @@ class ExcelStore:
         if row is None:
             return False
         ws.delete_rows(row, 1)
+        self._rows_cache.pop(TEACHERS_SHEET, None)
+        self._drop_pay_counts("teacher")
+        self._sync_id_map(TEACHERS_SHEET, ws, [], teacher_id, None)
         self._save(wb)
         return True
 
+    def _payments(self, entity: str) -> dict[tuple[str, int, int], dict[str, Any]]:
+        idx = self._pay_index.get(entity)
+        if idx is None:
+            idx = {}
+            id_col = "student_id" if entity == "student" else "teacher_id"
+            sheet = STUDENT_PAYMENTS_SHEET if entity == "student" else TEACHER_PAYMENTS_SHEET
+            for r in self._read_sheet(sheet):
+                try:
+                    key = (str(r.get(id_col, "")), int(r.get("year", 0)), int(r.get("month", 0)))
+                except (TypeError, ValueError):
+                    continue
+                idx.setdefault(key, r)
+            self._pay_index[entity] = idx
+        return idx
+
+    def _drop_pay_counts(self, entity: str) -> None:
+        for key in [k for k in self._pay_counts if k[0] == entity]:
+            del self._pay_counts[key]
+
+    @_locked
     def get_payment_record(self, entity: str, person_id: str, year: int, month: int) -> dict[str, Any]:
         """Get full payment record including status and amount."""
-        wb = self._load()
-        sheet = STUDENT_PAYMENTS_SHEET if entity == "student" else TEACHER_PAYMENTS_SHEET
-        id_col = "student_id" if entity == "student" else "teacher_id"
-        ws = wb[sheet]
-        rows = self._sheet_to_dicts(ws)
-        for r in rows:
-            if str(r.get(id_col, "")) == person_id and int(r.get("year", 0)) == year and int(r.get("month", 0)) == month:
-                return r
+        r = self._payments(entity).get((person_id, year, month))
+        if r is not None:
+            return dict(r)
         return {"status": "Pending", "amount": 0.0}
 
     def get_payment_status(self, entity: str, person_id: str, year: int, month: int) -> str:
         rec = self.get_payment_record(entity, person_id, year, month)
         return str(rec.get("status", "Pending") or "Pending")
 
+    @_locked
     def set_payment(self, entity: str, person_id: str, year: int, month: int, status: str, amount: float) -> None:
         """Set payment status and amount for a person/month."""
         wb = self._load()
@@ -332,9 +620,11 @@ class ExcelStore:
                 break
 
         now = _iso_now()
+        was_paid = self.get_payment_status(entity, person_id, year, month).lower() == "paid"
         if target_row is None:
             data = {id_col: person_id, "year": year, "month": month, "status": status, "amount": amount, "updated_at": now}
             ws.append([data.get(h, "") for h in headers])
+            target_row = ws.max_row
         else:
             for col, h in enumerate(headers, start=1):
                 if h == "updated_at":
@@ -343,6 +633,16 @@ class ExcelStore:
                     ws.cell(row=target_row, column=col, value=status)
                 elif h == "amount":
                     ws.cell(row=target_row, column=col, value=amount)
+        if entity in self._pay_index:
+            self._pay_index[entity][(person_id, year, month)] = {
+                h: ws.cell(row=target_row, column=col).value for col, h in enumerate(headers, start=1)
+            }
+        counts = self._pay_counts.get((entity, year, month))
+        is_paid = status.lower() == "paid"
+        if counts is not None and was_paid != is_paid and person_id in self._people_ids(entity):
+            step = 1 if is_paid else -1
+            counts["paid"] += step
+            counts["pending"] -= step
         self._save(wb)
 
     def set_payment_status(self, entity: str, person_id: str, year: int, month: int, status: str) -> None:
@@ -351,39 +651,25 @@ class ExcelStore:
         amt = float(rec.get("amount", 0) or 0)
         self.set_payment(entity, person_id, year, month, status, amt)
 
+    @_locked
     def list_all_payments(self, entity: str) -> list[dict[str, Any]]:
         """Get all payment records for an entity type."""
-        wb = self._load()
         sheet = STUDENT_PAYMENTS_SHEET if entity == "student" else TEACHER_PAYMENTS_SHEET
-        ws = wb[sheet]
-        return self._sheet_to_dicts(ws)
+        return self._read_sheet(sheet)
 
+    @_locked
     def get_pending_months(self, entity: str, person_id: str, up_to_year: int, up_to_month: int, default_amount: float) -> list[dict[str, Any]]:
         """Get all unpaid months for a person up to given year/month, with amounts.
 
         Returns list of dicts with keys: year, month, amount.
         If a month has no record, it's considered pending with default_amount.
         """
-        all_payments = self.list_all_payments(entity)
-        id_col = "student_id" if entity == "student" else "teacher_id"
+        payments = self._payments(entity)
 
-        # Build lookup of existing payment records for this person
-        paid_lookup: dict[tuple[int, int], dict[str, Any]] = {}
-        for rec in all_payments:
-            if str(rec.get(id_col, "")) == person_id:
-                try:
-                    y = int(rec.get("year", 0))
-                    m = int(rec.get("month", 0))
-                    paid_lookup[(y, m)] = rec
-                except Exception:
-                    pass
-
-        # Determine start year/month (we'll check last 24 months max to avoid infinite loops)
+        # Check the last 24 months only, oldest first.
         pending: list[dict[str, Any]] = []
-        # Go back up to 24 months
-        y, m = up_to_year, up_to_month
-        for _ in range(24):
-            rec = paid_lookup.get((y, m))
+        for y, m in _months_back(up_to_year, up_to_month, 24):
+            rec = payments.get((person_id, y, m))
             if rec is None:
                 # No record = pending with default amount
                 pending.append({"year": y, "month": m, "amount": default_amount})
@@ -392,12 +678,6 @@ class ExcelStore:
                 if amt <= 0:
                     amt = default_amount
                 pending.append({"year": y, "month": m, "amount": amt})
-            # Move to previous month
-            m -= 1
-            if m < 1:
-                m = 12
-                y -= 1
-        pending.reverse()  # oldest first
         return pending
 
     def get_total_pending(self, entity: str, person_id: str, up_to_year: int, up_to_month: int, default_amount: float) -> float:
@@ -405,30 +685,83 @@ class ExcelStore:
         pending = self.get_pending_months(entity, person_id, up_to_year, up_to_month, default_amount)
         return sum(p["amount"] for p in pending)
 
+    def _people_ids(self, entity: str) -> dict[str, dict[str, Any]]:
+        if entity == "student":
+            return self._id_map(STUDENTS_SHEET, "student_id")
+        return self._id_map(TEACHERS_SHEET, "teacher_id")
+
+    @_locked
     def payment_stats(self, entity: str, year: int, month: int) -> dict[str, int]:
-        people = self.list_students() if entity == "student" else self.list_teachers()
-        id_key = "student_id" if entity == "student" else "teacher_id"
-        paid = 0
-        pending = 0
-        for p in people:
-            pid = str(p.get(id_key, ""))
-            if not pid:
-                continue
-            st = self.get_payment_status(entity, pid, year, month)
-            if st.lower() == "paid":
-                paid += 1
-            else:
-                pending += 1
-        return {"paid": paid, "pending": pending, "total": paid + pending}
+        """Paid/pending head counts for a month.
 
+        Computed once per (entity, year, month) and then adjusted by set_payment;
+        adding or removing people drops the entity's counts.
+        """
+        counts = self._pay_counts.get((entity, year, month))
+        if counts is None:
+            payments = self._payments(entity)
+            paid = 0
+            pending = 0
+            for pid in self._people_ids(entity):
+                rec = payments.get((pid, year, month))
+                if rec is not None and str(rec.get("status", "Pending") or "Pending").lower() == "paid":
+                    paid += 1
+                else:
+                    pending += 1
+            counts = self._pay_counts[(entity, year, month)] = {"paid": paid, "pending": pending}
+        return {"paid": counts["paid"], "pending": counts["pending"], "total": counts["paid"] + counts["pending"]}
+
+    @_locked
     def add_event(self, event: AppEvent) -> None:
+        self._append_events([event])
+
+    @_locked
+    def add_events(self, events: Iterable[AppEvent]) -> None:
+        """Append several events with a single save."""
+        self._append_events(list(events))
+
+    def _append_events(self, events: list[AppEvent]) -> None:
+        if not events:
+            return
         wb = self._load()
         ws = wb[ACTIVITY_SHEET]
-        ws.append([event.timestamp, event.action, event.entity_type, event.entity_id, event.details])
+        for event in events:
+            ws.append([event.timestamp, event.action, event.entity_type, event.entity_id, event.details])
+            if self._events is not None:
+                self._events.append(
+                    {
+                        "timestamp": event.timestamp,
+                        "action": event.action,
+                        "entity_type": event.entity_type,
+                        "entity_id": event.entity_id,
+                        "details": event.details,
+                    }
+                )
         self._save(wb)
 
+    def _event_rows(self) -> list[dict[str, Any]]:
+        if self._events is None:
+            self._events = self._read_sheet(ACTIVITY_SHEET)
+        return self._events
+
+    @_locked
     def list_events(self, limit: int = 500) -> list[dict[str, Any]]:
-        wb = self._load()
-        ws = wb[ACTIVITY_SHEET]
-        rows = self._sheet_to_dicts(ws)
-        return rows[-limit:]
+        return [dict(r) for r in self._event_rows()[-limit:]]
+
+    @_locked
+    def list_events_desc(self, limit: int = 700, since_ts: str | None = None) -> list[dict[str, Any]]:
+        """Newest-first events, at most ``limit`` of them.
+
+        With ``since_ts``, stop at the first event older than it; events stamped exactly
+        ``since_ts`` are included so callers can tell same-second events apart.
+        """
+        out: list[dict[str, Any]] = []
+        if limit <= 0:
+            return out
+        for r in reversed(self._event_rows()):
+            if since_ts is not None and str(r.get("timestamp") or "") < since_ts:
+                break
+            out.append(dict(r))
+            if len(out) >= limit:
+                break
+        return out
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import sys
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Sequence
 
 import wx
 import wx.adv
@@ -128,14 +128,14 @@ class StudentDialog(wx.Dialog):
         title: str,
         student_id: str,
         initial: dict[str, Any] | None = None,
-        custom_fields: list[str] | None = None,
+        custom_fields: Sequence[str] | None = None,
     ):
         super().__init__(parent, title=title, style=wx.DEFAULT_DIALOG_STYLE | wx.RESIZE_BORDER)
         self.SetMinSize((560, 520))
 
         self.student_id = student_id
         self.initial = initial or {}
-        self.custom_fields = custom_fields or []
+        self.custom_fields = custom_fields or ()
 
         root = wx.Panel(self)
         sizer = wx.BoxSizer(wx.VERTICAL)
@@ -635,30 +635,12 @@ class HTSMSFrame(wx.Frame):
             self.err_logger.log_exception(e, "wx_on_teacher_selected")
 
     # --------- CRUD dialogs (basic; upgraded next) ---------
-    def _next_id(self, entity: str, prefix: str, existing_ids: list[str]) -> str:
-        max_n = 0
-        for eid in existing_ids:
-            if not eid.startswith(prefix):
-                continue
-            tail = eid[len(prefix) :]
-            digits = "".join(ch for ch in tail if ch.isdigit())
-            if digits:
-                try:
-                    max_n = max(max_n, int(digits))
-                except Exception:
-                    pass
-        return f"{prefix}{max_n + 1:04d}"
-
     def _get_student_by_id(self, student_id: str) -> dict[str, Any] | None:
-        for r in self.store.list_students():
-            if str(r.get("student_id", "")).strip() == student_id:
-                return r
-        return None
+        return self.store.get_student(student_id)
 
     def add_student(self) -> None:
         try:
-            existing = [str(s.get("student_id", "")) for s in self.store.list_students()]
-            sid = self._next_id("student", self.settings.student_id_prefix, existing)
+            sid = self.store.next_student_id(self.settings.student_id_prefix)
 
             dlg = StudentDialog(
                 self,